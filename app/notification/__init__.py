@@ -11,6 +11,9 @@ from app.models.core import CoreResponse
 from app.models.admin import AdminDetails
 from app.models.user import UserNotificationResponse
 from app.settings import notification_enable
+from app.utils.logger import get_logger
+
+logger = get_logger("Notification")
 
 
 async def create_host(host: BaseHost, by: str):
@@ -107,19 +110,56 @@ async def create_admin(admin: AdminDetails, by: str):
         await asyncio.gather(ds.create_admin(admin, by), tg.create_admin(admin, by))
 
 
+def _modify_admin_sends(admin: AdminDetails, by: str):
+    return ds.modify_admin(admin, by), tg.modify_admin(admin, by)
+
+
+def _remove_admin_sends(username: str, by: str):
+    return ds.remove_admin(username, by), tg.remove_admin(username, by)
+
+
+def _admin_usage_reset_sends(admin: AdminDetails, by: str):
+    return ds.admin_reset_usage(admin, by), tg.admin_reset_usage(admin, by)
+
+
 async def modify_admin(admin: AdminDetails, by: str):
     if (await notification_enable()).admin.modify:
-        await asyncio.gather(ds.modify_admin(admin, by), tg.modify_admin(admin, by))
+        await asyncio.gather(*_modify_admin_sends(admin, by))
 
 
 async def remove_admin(username: str, by: str):
     if (await notification_enable()).admin.delete:
-        await asyncio.gather(ds.remove_admin(username, by), tg.remove_admin(username, by))
+        await asyncio.gather(*_remove_admin_sends(username, by))
 
 
 async def admin_usage_reset(admin: AdminDetails, by: str):
     if (await notification_enable()).admin.reset_usage:
-        await asyncio.gather(ds.admin_reset_usage(admin, by), tg.admin_reset_usage(admin, by))
+        await asyncio.gather(*_admin_usage_reset_sends(admin, by))
+
+
+async def _notify_bulk_item(*coros):
+    # A failing send is logged instead of raised so the remaining items still get notified
+    for result in await asyncio.gather(*coros, return_exceptions=True):
+        if isinstance(result, Exception):
+            logger.error(f"Bulk notification failed: {result}")
+
+
+async def bulk_modify_admin(admins: list[AdminDetails], by: str):
+    if (await notification_enable()).admin.modify:
+        for admin in admins:
+            await _notify_bulk_item(*_modify_admin_sends(admin, by))
+
+
+async def bulk_remove_admin(usernames: list[str], by: str):
+    if (await notification_enable()).admin.delete:
+        for username in usernames:
+            await _notify_bulk_item(*_remove_admin_sends(username, by))
+
+
+async def bulk_admin_usage_reset(admins: list[AdminDetails], by: str):
+    if (await notification_enable()).admin.reset_usage:
+        for admin in admins:
+            await _notify_bulk_item(*_admin_usage_reset_sends(admin, by))
 
 
 async def admin_login(username: str, password: str, client_ip: str, success: bool):
@@ -155,15 +195,27 @@ async def modify_user(user: UserNotificationResponse, by: AdminDetails):
         )
 
 
+def _remove_user_sends(user: UserNotificationResponse, by: AdminDetails):
+    return ds.remove_user(user, by.username), tg.remove_user(user, by.username)
+
+
 async def remove_user(user: UserNotificationResponse, by: AdminDetails):
     if (await notification_enable()).user.delete:
         await asyncio.gather(
-            ds.remove_user(user, by.username),
-            tg.remove_user(user, by.username),
+            *_remove_user_sends(user, by),
             wh.notify(wh.UserDeleted(username=user.username, user=user, by=by)),
         )
 
 
+async def bulk_remove_user(users: list[UserNotificationResponse], by: AdminDetails):
+    if (await notification_enable()).user.delete:
+        for user in users:
+            await _notify_bulk_item(*_remove_user_sends(user, by))
+        await _notify_bulk_item(
+            wh.bulk_notify([wh.UserDeleted(username=user.username, user=user, by=by) for user in users])
+        )
+
+
 async def reset_user_data_usage(user: UserNotificationResponse, by: AdminDetails):
     if (await notification_enable()).user.reset_data_usage:
         await asyncio.gather(
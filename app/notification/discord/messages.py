@@ -1,6 +1,8 @@
 # In this file, we define message templates for Discord notifications.
 # Using templates helps to avoid string concatenation and improves code readability.
 
+from . import colors
+
 USER_CREATED = {
     "title": "New User Created",
     "fields": [
@@ -161,42 +163,49 @@ CREATE_NODE = {
     "title": "Create Node",
     "description": "**Name:** {name}\n**Address:** {address}\n**Port:** {port}",
     "footer": {"text": "ID: {id}\nBy: {by}"},
+    "color": colors.GREEN,
 }
 
 MODIFY_NODE = {
     "title": "Modify Node",
     "description": "**Name:** {name}\n**Address:** {address}\n**Port:** {port}",
     "footer": {"text": "ID: {id}\nBy: {by}"},
+    "color": colors.YELLOW,
 }
 
 REMOVE_NODE = {
     "title": "Remove Node",
     "description": "**Name:** {name}\n**Address:** {address}\n**Port:** {port}",
     "footer": {"text": "ID: {id}\nBy: {by}"},
+    "color": colors.RED,
 }
 
 CONNECT_NODE = {
     "title": "Connect Node",
     "description": "**Name:** {name}\n" + "**Node Version:** {node_version}\n" + "**Core Version:** {core_version}",
     "footer": {"text": "ID: {id}"},
+    "color": colors.GREEN,
 }
 
 ERROR_NODE = {
     "title": "Error Node",
     "description": "**Name:** {name}\n**Error:** {error}",
     "footer": {"text": "ID: {id}"},
+    "color": colors.RED,
 }
 
 LIMITED_NODE = {
     "title": "⚠️ Limited Node",
     "description": "**Name:** {name}\n**Data Limit:** {data_limit}\n**Used Traffic:** {used_traffic}",
     "footer": {"text": "ID: {id}"},
+    "color": colors.YELLOW,
 }
 
 RESET_NODE_USAGE = {
     "title": "🔁 Reset Node Usage",
     "description": "**Name:** {name}\n**Uplink at Reset:** {uplink}\n**Downlink at Reset:** {downlink}",
     "footer": {"text": "ID: {id}\nBy: {by}"},
+    "color": colors.BLUE,
 }
 
 CREATE_USER_TEMPLATE = {
@@ -8,7 +8,7 @@ from app.settings import notification_settings
 from app.utils.helpers import escape_ds_markdown_list, escape_ds_markdown
 from app.utils.system import readable_size
 
-from . import colors, messages
+from . import messages
 
 ENTITY = "node"
 
@@ -22,7 +22,6 @@ async def create_node(node: NodeResponse, by: str):
         "content": "",
         "embeds": [message],
     }
-    data["embeds"][0]["color"] = colors.GREEN
     settings: NotificationSettings = await notification_settings()
     if settings.notify_discord:
         webhook = get_discord_webhook(settings, ENTITY)
@@ -38,7 +37,6 @@ async def modify_node(node: NodeResponse, by: str):
         "content": "",
         "embeds": [message],
     }
-    data["embeds"][0]["color"] = colors.YELLOW
     settings: NotificationSettings = await notification_settings()
     if settings.notify_discord:
         webhook = get_discord_webhook(settings, ENTITY)
@@ -54,7 +52,6 @@ async def remove_node(node: NodeResponse, by: str):
         "content": "",
         "embeds": [message],
     }
-    data["embeds"][0]["color"] = colors.RED
     settings: NotificationSettings = await notification_settings()
     if settings.notify_discord:
         webhook = get_discord_webhook(settings, ENTITY)
@@ -72,7 +69,6 @@ async def connect_node(node: NodeNotification):
         "content": "",
         "embeds": [message],
     }
-    data["embeds"][0]["color"] = colors.GREEN
     settings: NotificationSettings = await notification_settings()
     if settings.notify_discord:
         webhook = get_discord_webhook(settings, ENTITY)
@@ -88,7 +84,6 @@ async def error_node(node: NodeNotification):
         "content": "",
         "embeds": [message],
     }
-    data["embeds"][0]["color"] = colors.RED
     settings: NotificationSettings = await notification_settings()
     if settings.notify_discord:
         webhook = get_discord_webhook(settings, ENTITY)
@@ -106,7 +101,6 @@ async def limited_node(node: NodeNotification, data_limit: int, used_traffic: in
         "content": "",
         "embeds": [message],
     }
-    data["embeds"][0]["color"] = colors.YELLOW
     settings: NotificationSettings = await notification_settings()
     if settings.notify_discord:
         webhook = get_discord_webhook(settings, ENTITY)
@@ -124,7 +118,6 @@ async def reset_node_usage(node: NodeResponse, by: str, uplink: int, downlink: i
         "content": "",
         "embeds": [message],
     }
-    data["embeds"][0]["color"] = colors.BLUE
     settings: NotificationSettings = await notification_settings()
     if settings.notify_discord:
         webhook = get_discord_webhook(settings, ENTITY)
@@ -1,10 +1,9 @@
-from html import escape
-
 from app.notification.client import send_telegram_message
 from app.notification.helpers import get_telegram_channel
 from app.models.core import CoreResponse
 from app.models.settings import NotificationSettings
 from app.settings import notification_settings
+from app.utils.helpers import escape_tg_html_text
 
 from .utils import escape_html_core
 from . import messages
@@ -39,7 +38,7 @@ async def modify_core(core: CoreResponse, by: str):
 
 
 async def remove_core(core_id: int, by: str):
-    data = messages.REMOVE_CORE.format(id=core_id, by=escape(by))
+    data = messages.REMOVE_CORE.format(id=core_id, by=escape_tg_html_text(by))
     settings: NotificationSettings = await notification_settings()
     if settings.notify_telegram:
         chat_id, topic_id = get_telegram_channel(settings, ENTITY)
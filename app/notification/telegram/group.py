@@ -1,11 +1,9 @@
-from html import escape
-
 from app.notification.client import send_telegram_message
 from app.notification.helpers import get_telegram_channel
 from app.models.group import GroupResponse
 from app.models.settings import NotificationSettings
 from app.settings import notification_settings
-from app.utils.helpers import escape_tg_html
+from app.utils.helpers import escape_tg_html, escape_tg_html_text
 from . import messages
 
 ENTITY = "group"
@@ -34,7 +32,7 @@ async def modify_group(group: GroupResponse, by: str):
 
 
 async def remove_group(group_id: int, by: str):
-    data = messages.REMOVE_GROUP.format(id=group_id, by=escape(by))
+    data = messages.REMOVE_GROUP.format(id=group_id, by=escape_tg_html_text(by))
     settings: NotificationSettings = await notification_settings()
     if settings.notify_telegram:
         chat_id, topic_id = get_telegram_channel(settings, ENTITY)
@@ -1,11 +1,9 @@
-from html import escape
-
 from app.notification.client import send_telegram_message
 from app.notification.helpers import get_telegram_channel
 from app.models.host import BaseHost
 from app.models.settings import NotificationSettings
 from app.settings import notification_settings
-from app.utils.helpers import escape_tg_html
+from app.utils.helpers import escape_tg_html, escape_tg_html_text
 
 from .utils import escape_html_host
 from . import messages
@@ -41,7 +39,7 @@ async def remove_host(host: BaseHost, by: str):
 
 
 async def modify_hosts(by: str):
-    data = messages.MODIFY_HOSTS.format(by=escape(by))
+    data = messages.MODIFY_HOSTS.format(by=escape_tg_html_text(by))
     settings: NotificationSettings = await notification_settings()
     if settings.notify_telegram:
         chat_id, topic_id = get_telegram_channel(settings, ENTITY)
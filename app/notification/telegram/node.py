@@ -1,11 +1,9 @@
-from html import escape
-
 from app.notification.client import send_telegram_message
 from app.notification.helpers import get_telegram_channel
 from app.models.node import NodeNotification, NodeResponse
 from app.models.settings import NotificationSettings
 from app.settings import notification_settings
-from app.utils.helpers import escape_tg_html
+from app.utils.helpers import escape_tg_html, escape_tg_html_text
 from app.utils.system import readable_size
 from . import messages
 
@@ -41,7 +39,7 @@ async def remove_node(node: NodeResponse, by: str):
 
 async def connect_node(node: NodeNotification):
     data = messages.CONNECT_NODE.format(
-        name=escape(node.name), node_version=node.node_version, core_version=node.core_version, id=node.id
+        name=escape_tg_html_text(node.name), node_version=node.node_version, core_version=node.core_version, id=node.id
     )
     settings: NotificationSettings = await notification_settings()
     if settings.notify_telegram:
@@ -60,7 +58,7 @@ async def error_node(node: NodeNotification):
 
 async def limited_node(node: NodeNotification, data_limit: int, used_traffic: int):
     data = messages.LIMITED_NODE.format(
-        name=escape(node.name),
+        name=escape_tg_html_text(node.name),
         data_limit=readable_size(data_limit),
         used_traffic=readable_size(used_traffic),
         id=node.id,
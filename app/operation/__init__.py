@@ -217,8 +217,10 @@ class BaseOperation:
             await self.raise_error(message="Admin not found", code=404)
         return db_admin
 
-    async def get_validated_admin_by_id(self, db: AsyncSession, id: int) -> DBAdmin:
-        db_admin = await get_admin_by_id(db, id)
+    async def get_validated_admin_by_id(
+        self, db: AsyncSession, id: int, load_users: bool = True, load_usage_logs: bool = True
+    ) -> DBAdmin:
+        db_admin = await get_admin_by_id(db, id, load_users=load_users, load_usage_logs=load_usage_logs)
         if not db_admin:
             await self.raise_error(message="Admin not found", code=404)
         return db_admin
@@ -9,6 +9,7 @@ from app.db import AsyncSession
 from app.db.crud.admin import (
     create_admin,
     find_admins_by_telegram_id,
+    get_admin,
     get_admin_usages,
     get_admins,
     get_admins_count,
@@ -19,7 +20,7 @@ from app.db.crud.admin import (
     update_admin,
 )
 from app.db.crud.bulk import activate_all_disabled_users, disable_all_active_users
-from app.db.crud.user import get_users, remove_users
+from app.db.crud.user import get_users, get_users_count, remove_users
 from app.db.models import Admin
 from app.models.admin import (
     AdminCreate,
@@ -180,6 +181,17 @@ class AdminOperation(BaseOperation):
             )
         return admins  # type: ignore[return-value]
 
+    async def get_admin_by_username(self, db: AsyncSession, username: str) -> Admin | None:
+        """Fetch a single admin by username without its relationships, or None if it does not exist."""
+        return await get_admin(db, username, load_users=False, load_usage_logs=False)
+
+    async def get_admin_with_user_count(self, db: AsyncSession, username: str) -> tuple[Admin, int] | None:
+        """Fetch an admin by username with the number of users it owns, counted in SQL instead of loading them."""
+        db_admin = await get_admin(db, username, load_users=False, load_usage_logs=False)
+        if not db_admin:
+            return None
+        return db_admin, await get_users_count(db, admin_id=db_admin.id)
+
     async def get_admins_simple(
         self,
         db: AsyncSession,
@@ -277,8 +289,7 @@ class AdminOperation(BaseOperation):
         for user in serialized_users:
             await sync_remove_user(user)
 
-        for user in serialized_users:
-            asyncio.create_task(notification.remove_user(user, admin))
+        asyncio.create_task(notification.bulk_remove_user(serialized_users, admin))
 
         logger.info(
             f'Admin "{admin.username}" deleted {len(serialized_users)} users belonging to admin "{target_username}"'
@@ -410,7 +421,7 @@ class AdminOperation(BaseOperation):
         if self.operator_type != OperatorType.CLI:
             for username in usernames:
                 logger.info(f'Admin "{username}" deleted by admin "{admin.username}"')
-                asyncio.create_task(notification.remove_admin(username, admin.username))
+            asyncio.create_task(notification.bulk_remove_admin(usernames, admin.username))
 
         return RemoveAdminsResponse(admins=usernames, count=len(db_admins))
 
@@ -476,9 +487,9 @@ class AdminOperation(BaseOperation):
 
         await db.commit()
 
+        modified_admins = [AdminDetails.model_validate(db_admin) for db_admin in admins_to_update]
+        asyncio.create_task(notification.bulk_modify_admin(modified_admins, current_admin.username))
         for db_admin in admins_to_update:
-            modified_admin = AdminDetails.model_validate(db_admin)
-            asyncio.create_task(notification.modify_admin(modified_admin, current_admin.username))
             logger.info(
                 f'Admin "{db_admin.username}" bulk {"disabled" if is_disabled else "enabled"} by admin "{current_admin.username}"'
             )
@@ -490,12 +501,14 @@ class AdminOperation(BaseOperation):
     ) -> BulkAdminsActionResponse:
         db_admins = await self._get_validated_bulk_admins(db, bulk_admins.usernames)
 
+        reseted_admins = []
         for db_admin in db_admins:
             db_admin = await reset_admin_usage(db, db_admin=db_admin)
-            reseted_admin = AdminDetails.model_validate(db_admin)
-            asyncio.create_task(notification.admin_usage_reset(reseted_admin, admin.username))
+            reseted_admins.append(AdminDetails.model_validate(db_admin))
             logger.info(f'Admin "{db_admin.username}" usage has been reset by admin "{admin.username}"')
 
+        asyncio.create_task(notification.bulk_admin_usage_reset(reseted_admins, admin.username))
+
         return self._build_bulk_action_response(db_admins)
 
     async def bulk_disable_all_active_users_for_admins(
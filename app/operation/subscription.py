@@ -1,4 +1,5 @@
 import re
+from functools import lru_cache
 from json import dumps as json_dumps
 from typing import Any
 
@@ -78,6 +79,11 @@ client_config = {
 }
 
 
+@lru_cache(maxsize=256)
+def _compile_rule_pattern(pattern: str) -> re.Pattern:
+    return re.compile(pattern)
+
+
 class SubscriptionOperation(BaseOperation):
     _ENCODED_RULE_RESPONSE_HEADERS = {"announce", "profile-title"}
 
@@ -94,14 +100,14 @@ class SubscriptionOperation(BaseOperation):
     async def detect_client_type(user_agent: str, rules: list[SubRule]) -> ConfigFormat | None:
         """Detect the appropriate client configuration based on the user agent."""
         for rule in rules:
-            if re.match(rule.pattern, user_agent):
+            if _compile_rule_pattern(rule.pattern).match(user_agent):
                 return rule.target
 
     @staticmethod
     def detect_client_rule(user_agent: str, rules: list[SubRule]) -> SubRule | None:
         """Return the first matching subscription rule for the provided user agent."""
         for rule in rules:
-            if re.match(rule.pattern, user_agent):
+            if _compile_rule_pattern(rule.pattern).match(user_agent):
                 return rule
         return None
 
@@ -2,45 +2,126 @@ import base64
 import hashlib
 import json
 import re
+from collections.abc import Callable, Mapping
 from enum import Enum
+from functools import lru_cache
+from random import choice
 from typing import Any, Literal
 from urllib.parse import quote, urlencode
 
 from app.models.subscription import SubscriptionInboundData
 
+_SNAKE_TO_CAMEL_RE = re.compile(r"_([a-z])")
+
+
+def _camel_repl(match: re.Match) -> str:
+    return match.group(1).upper()
+
+
+def _clean_dict(d: dict) -> dict:
+    new_dict = {}
+    for k, v in d.items():
+        if v in (None, "", 0):
+            continue
+        if isinstance(v, dict):
+            if cleaned_dict := _clean_dict(v):
+                new_dict[k] = cleaned_dict
+        elif isinstance(v, Enum):
+            new_dict[k] = v.value
+        else:
+            new_dict[k] = v
+    return new_dict
+
+
+@lru_cache(maxsize=64)
+def _load_user_agent_list(template_content: str | None) -> tuple[str, ...]:
+    """Parse the "list" of a user-agent template; memoized since templates rarely change."""
+    data = json.loads(template_content) if template_content else {}
+    if "list" in data and isinstance(data["list"], list):
+        return tuple(data["list"])
+    return ()
+
+
+@lru_cache(maxsize=512)
+def _parse_ports(port: str) -> tuple[str, ...]:
+    """Split a comma-separated port list; the same strings recur across hosts and renders."""
+    return tuple(port.split(","))
+
+
+@lru_cache(maxsize=65536)
+def _ensure_base64_password(password: str, method: str) -> str:
+    # Memoized: the same user password is derived once per method instead of per inbound
+    # 16 and 32 byte keys always encode with "=" padding, so plain passwords skip the decode attempt
+    if "=" in password:
+        try:
+            # Check if it's already a valid base64 string
+            decoded_bytes = base64.b64decode(password)
+            # Check if length is appropriate
+            if ("aes-128-gcm" in method and len(decoded_bytes) == 16) or (
+                ("aes-256-gcm" in method or "chacha20-poly1305" in method) and len(decoded_bytes) == 32
+            ):
+                # Already correct length
+                return password
+        except Exception:
+            # Not a valid base64 string
+            pass
+
+    # Hash the password to get a consistent byte array (digest is identical either way;
+    # usedforsecurity=False just lets OpenSSL skip its FIPS-approved dispatch path)
+    hash_bytes = hashlib.sha256(password.encode("utf-8"), usedforsecurity=False).digest()
+
+    if "aes-128-gcm" in method:
+        key_bytes = hash_bytes[:16]  # First 16 bytes for AES-128
+    else:
+        key_bytes = hash_bytes[:32]  # First 32 bytes for AES-256 or ChaCha20
+
+    return base64.b64encode(key_bytes).decode("ascii")
+
+
+@lru_cache(maxsize=65536)
+def _password_to_2022(inbound_password: str, user_password: str, method: str) -> str:
+    # Memoized on the full (inbound, user, method) key so repeat renders skip the derivation and join
+    return f"{inbound_password}:{_ensure_base64_password(user_password, method)}"
+
 
 class BaseSubscription:
+    __slots__ = ("_remark_set", "grpc_user_agent_data", "proxy_remarks", "user_agent_list")
+
     def __init__(
         self,
         user_agent_template_content: str | None = None,
         grpc_user_agent_template_content: str | None = None,
     ):
         self.proxy_remarks = []
-        user_agent_data = json.loads(user_agent_template_content) if user_agent_template_content else {}
-        if "list" in user_agent_data and isinstance(user_agent_data["list"], list):
-            self.user_agent_list = user_agent_data["list"]
-        else:
-            self.user_agent_list = []
-
-        grpc_user_agent_data = json.loads(grpc_user_agent_template_content) if grpc_user_agent_template_content else {}
-
-        if "list" in grpc_user_agent_data and isinstance(grpc_user_agent_data["list"], list):
-            self.grpc_user_agent_data = grpc_user_agent_data["list"]
-        else:
-            self.grpc_user_agent_data = []
-
-        del user_agent_data, grpc_user_agent_data
+        self._remark_set: set[str] = set()
+        self.user_agent_list = _load_user_agent_list(user_agent_template_content)
+        self.grpc_user_agent_data = _load_user_agent_list(grpc_user_agent_template_content)
 
     def _remark_validation(self, remark):
-        if remark not in self.proxy_remarks:
+        if remark not in self._remark_set:
             return remark
         c = 2
         while True:
             new = f"{remark} ({c})"
-            if new not in self.proxy_remarks:
+            if new not in self._remark_set:
                 return new
             c += 1
 
+    def _add_remark(self, remark: str):
+        self.proxy_remarks.append(remark)
+        self._remark_set.add(remark)
+
+    def _resolve_handler(self, registry: Mapping[str, str], key: str) -> Callable | None:
+        """Return the bound method registered under key, looked up by name so subclass overrides apply"""
+        name = registry.get(key)
+        return getattr(self, name) if name else None
+
+    def _select_port(self, port: int | str) -> int:
+        """Select a random port if multiple are provided"""
+        if isinstance(port, str):
+            return int(choice(_parse_ports(port)))
+        return port
+
     def _normalize_and_remove_none_values(self, data: dict) -> dict:
         """
         Clean dictionary by removing None, empty strings, and 0 values.
@@ -52,25 +133,12 @@ class BaseSubscription:
         Returns:
             Cleaned dictionary with empty values removed
         """
-
-        def clean_dict(d: dict) -> dict:
-            new_dict = {}
-            for k, v in d.items():
-                if v not in (None, "", 0):
-                    if isinstance(v, dict):
-                        if cleaned_dict := clean_dict(v):
-                            new_dict[k] = cleaned_dict
-                    else:
-                        if isinstance(v, Enum):
-                            new_dict[k] = v.value
-                        else:
-                            new_dict[k] = v
-            return new_dict
-
-        return clean_dict(data)
+        return _clean_dict(data)
 
     def snake_to_camel(self, snake_str):
-        return re.sub(r"_([a-z])", lambda match: match.group(1).upper(), snake_str)
+        if "_" not in snake_str:
+            return snake_str
+        return _SNAKE_TO_CAMEL_RE.sub(_camel_repl, snake_str)
 
     @staticmethod
     def get_grpc_gun(path: str) -> str:
@@ -78,8 +146,8 @@ class BaseSubscription:
         if not path.startswith("/"):
             return path
 
-        servicename = path.rsplit("/", 1)[0]
-        streamname = path.rsplit("/", 1)[1].split("|")[0]
+        servicename, _, last = path.rpartition("/")
+        streamname = last.split("|", 1)[0]
 
         if streamname == "Tun":
             return servicename[1:]
@@ -92,8 +160,8 @@ class BaseSubscription:
         if not path.startswith("/"):
             return path
 
-        servicename = path.rsplit("/", 1)[0]
-        streamname = path.rsplit("/", 1)[1].split("|")[1]
+        servicename, _, last = path.rpartition("/")
+        streamname = last.split("|", 2)[1]
 
         return f"{servicename}/{streamname}"
 
@@ -104,28 +172,7 @@ class BaseSubscription:
         - aes-128-gcm: 16 bytes key (22 chars in base64)
         - aes-256-gcm and chacha20-poly1305: 32 bytes key (44 chars in base64)
         """
-        try:
-            # Check if it's already a valid base64 string
-            decoded_bytes = base64.b64decode(password)
-            # Check if length is appropriate
-            if ("aes-128-gcm" in method and len(decoded_bytes) == 16) or (
-                ("aes-256-gcm" in method or "chacha20-poly1305" in method) and len(decoded_bytes) == 32
-            ):
-                # Already correct length
-                return password
-        except Exception:
-            # Not a valid base64 string
-            pass
-
-        # Hash the password to get a consistent byte array
-        hash_bytes = hashlib.sha256(password.encode("utf-8")).digest()
-
-        if "aes-128-gcm" in method:
-            key_bytes = hash_bytes[:16]  # First 16 bytes for AES-128
-        else:
-            key_bytes = hash_bytes[:32]  # First 32 bytes for AES-256 or ChaCha20
-
-        return base64.b64encode(key_bytes).decode("ascii")
+        return _ensure_base64_password(password, method)
 
     @staticmethod
     def password_to_2022(inbound_password: str, user_password: str, method: str) -> str:
@@ -133,8 +180,7 @@ class BaseSubscription:
         Convert a password to the format required for 2022-blake3 methods,
         ensuring correct key length.
         """
-        base64_string = BaseSubscription.ensure_base64_password(user_password, method)
-        return f"{inbound_password}:{base64_string}"
+        return _password_to_2022(inbound_password, user_password, method)
 
     @staticmethod
     def detect_shadowsocks_2022(
@@ -142,7 +188,7 @@ class BaseSubscription:
     ) -> tuple[str, str]:
         """Detect and handle Shadowsocks 2022 password format"""
         if is_2022:
-            password = BaseSubscription.password_to_2022(inbound_password, user_password, inbound_method)
+            password = _password_to_2022(inbound_password, user_password, inbound_method)
             method = inbound_method
         else:
             password = user_password
@@ -197,7 +243,7 @@ class BaseSubscription:
             return None
 
         validated_remark = self._remark_validation(remark)
-        self.proxy_remarks.append(validated_remark)
+        self._add_remark(validated_remark)
 
         payload = {
             "publickey": public_key,
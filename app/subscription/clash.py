@@ -1,8 +1,16 @@
+from collections.abc import Mapping
 from random import choice
+from types import MappingProxyType
+from typing import ClassVar
 from uuid import UUID
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
 from app.models.subscription import (
     GRPCTransportConfig,
     SubscriptionInboundData,
@@ -16,8 +24,41 @@ from app.utils.helpers import yml_uuid_representer
 
 from . import BaseSubscription
 
+# UUIDs in proxy nodes are dumped as plain strings (also used by the template "yaml" filter)
+yaml.add_representer(UUID, yml_uuid_representer)
+
+# Inbound network -> clash network; legacy splithttp is xhttp, http/h3 collapse to h2 and
+# httpupgrade is emitted as ws (with v2ray-http-upgrade set by the ws handler)
+_NETWORK_ALIASES = {"splithttp": "xhttp", "http": "h2", "h3": "h2", "httpupgrade": "ws"}
+
 
 class ClashConfiguration(BaseSubscription):
+    __slots__ = ("clash_template_content", "data")
+
+    transport_handlers: ClassVar[Mapping[str, str]] = MappingProxyType(
+        {
+            "http": "_transport_http",
+            "h2": "_transport_h2",
+            "ws": "_transport_ws",
+            "httpupgrade": "_transport_ws",
+            "grpc": "_transport_grpc",
+            "gun": "_transport_grpc",
+            "tcp": "_transport_tcp",
+            "raw": "_transport_tcp",
+            "xhttp": "_transport_xhttp",
+            "splithttp": "_transport_xhttp",
+        }
+    )
+
+    protocol_handlers: ClassVar[Mapping[str, str]] = MappingProxyType(
+        {
+            "vmess": "_build_vmess",
+            "trojan": "_build_trojan",
+            "shadowsocks": "_build_shadowsocks",
+            "wireguard": "_build_wireguard",
+        }
+    )
+
     def __init__(
         self,
         clash_template_content: str | None = None,
@@ -36,36 +77,16 @@ class ClashConfiguration(BaseSubscription):
             "rules": [],
         }
 
-        # Registry for transport config builders
-        self.transport_handlers = {
-            "http": self._transport_http,
-            "h2": self._transport_h2,
-            "ws": self._transport_ws,
-            "httpupgrade": self._transport_ws,
-            "grpc": self._transport_grpc,
-            "gun": self._transport_grpc,
-            "tcp": self._transport_tcp,
-            "raw": self._transport_tcp,
-            "xhttp": self._transport_xhttp,
-            "splithttp": self._transport_xhttp,
-        }
-
-        # Registry for protocol builders
-        self.protocol_handlers = {
-            "vmess": self._build_vmess,
-            "trojan": self._build_trojan,
-            "shadowsocks": self._build_shadowsocks,
-            "wireguard": self._build_wireguard,
-        }
-
     def render(self):
-        yaml.add_representer(UUID, yml_uuid_representer)
+        # The template is user-editable YAML, so it still has to be parsed once; libyaml's
+        # C loader is used when available. Dumping stays pure-Python since libyaml escapes emoji.
         return yaml.dump(
-            yaml.safe_load(
+            yaml.load(
                 render_template_string(
                     self.clash_template_content,
                     {"conf": self.data, "proxy_remarks": self.proxy_remarks},
                 ),
+                Loader=SafeLoader,
             ),
             sort_keys=False,
             allow_unicode=True,
@@ -108,10 +129,14 @@ class ClashConfiguration(BaseSubscription):
             max_early_data = int(max_early_data)
             early_data_header_name = "Sec-WebSocket-Protocol"
 
-        http_headers = dict(config.http_headers or {})
+        raw_headers = config.http_headers
         if host:
-            http_headers = {k: v for k, v in http_headers.items() if k not in ("Host", "host")}
+            http_headers = {k: v for k, v in raw_headers.items() if k not in ("Host", "host")} if raw_headers else {}
             http_headers["Host"] = host
+        else:
+            http_headers = dict(raw_headers) if raw_headers else {}
+        if random_user_agent:
+            http_headers["User-Agent"] = choice(self.user_agent_list)
 
         result = {
             "path": path,
@@ -121,8 +146,6 @@ class ClashConfiguration(BaseSubscription):
             "max-early-data": max_early_data if max_early_data and not is_httpupgrade else None,
             "early-data-header-name": early_data_header_name if max_early_data and not is_httpupgrade else None,
         }
-        if random_user_agent:
-            result["headers"]["User-Agent"] = choice(self.user_agent_list)
 
         return self._normalize_and_remove_none_values(result)
 
@@ -144,10 +167,11 @@ class ClashConfiguration(BaseSubscription):
     def _transport_tcp(self, config: TCPTransportConfig, path: str):
         """Build TCP transport config"""
         host = config.host if isinstance(config.host, str) else ""
-        http_headers = config.http_headers or {}
+        headers = dict(config.http_headers) if config.http_headers else {}
+        headers["Host"] = host
         result = {
             "path": [path] if path else None,
-            "headers": {**http_headers, "Host": host} if http_headers else {"Host": host},
+            "headers": headers,
         }
         return self._normalize_and_remove_none_values(result)
 
@@ -196,30 +220,16 @@ class ClashConfiguration(BaseSubscription):
         self, node: dict, inbound: SubscriptionInboundData, path: str, random_user_agent: bool = False
     ):
         """Apply transport settings using registry"""
-        network = inbound.network
-
-        # Normalize legacy splithttp -> xhttp
-        if network == "splithttp":
-            network = "xhttp"
-
-        # Normalize network type for clash
-        if network in ("http", "h2", "h3"):
-            network = "h2"
-        elif (
-            network in ("tcp", "raw")
-            and hasattr(inbound.transport_config, "header_type")
-            and inbound.transport_config.header_type == "http"
-        ):
+        network = _NETWORK_ALIASES.get(inbound.network, inbound.network)
+        if network in ("tcp", "raw") and getattr(inbound.transport_config, "header_type", None) == "http":
             network = "http"
 
         is_httpupgrade = inbound.network == "httpupgrade"
-        if is_httpupgrade:
-            network = "ws"
 
         node["network"] = network
 
         # Get transport handler
-        handler = self.transport_handlers.get(network)
+        handler = self._resolve_handler(self.transport_handlers, network)
         if not handler:
             node[f"{network}-opts"] = {}
             return
@@ -362,37 +372,29 @@ class ClashConfiguration(BaseSubscription):
         proxy_remark = self._remark_validation(remark)
 
         # Use registry to build node
-        handler = self.protocol_handlers.get(inbound.protocol)
+        handler = self._resolve_handler(self.protocol_handlers, inbound.protocol)
         if not handler:
             return
 
         node = handler(proxy_remark, address, inbound, settings)
         if node:
             self.data["proxies"].append(node)
-            self.proxy_remarks.append(proxy_remark)
+            self._add_remark(proxy_remark)
 
 
 class ClashMetaConfiguration(ClashConfiguration):
-    def __init__(
-        self,
-        clash_template_content: str | None = None,
-        user_agent_template_content: str | None = None,
-        grpc_user_agent_template_content: str | None = None,
-    ):
-        super().__init__(
-            clash_template_content=clash_template_content,
-            user_agent_template_content=user_agent_template_content,
-            grpc_user_agent_template_content=grpc_user_agent_template_content,
-        )
-        # Override protocol handlers to include vless
-        self.protocol_handlers = {
-            "vmess": self._build_vmess,
-            "vless": self._build_vless,
-            "trojan": self._build_trojan,
-            "shadowsocks": self._build_shadowsocks,
-            "hysteria": self._build_hysteria,
-            "wireguard": self._build_wireguard,
+    __slots__ = ()
+
+    protocol_handlers: ClassVar[Mapping[str, str]] = MappingProxyType(
+        {
+            "vmess": "_build_vmess",
+            "vless": "_build_vless",
+            "trojan": "_build_trojan",
+            "shadowsocks": "_build_shadowsocks",
+            "hysteria": "_build_hysteria",
+            "wireguard": "_build_wireguard",
         }
+    )
 
     def _apply_tls(self, node: dict, tls_config: TLSConfig, protocol: str):
         """Apply TLS settings with Reality support for Clash Meta"""
@@ -547,21 +549,17 @@ class ClashMetaConfiguration(ClashConfiguration):
             return
 
         # QUIC with header not supported
-        if (
-            inbound.network == "quic"
-            and hasattr(inbound.transport_config, "header_type")
-            and inbound.transport_config.header_type != "none"
-        ):
+        if inbound.network == "quic" and getattr(inbound.transport_config, "header_type", "none") != "none":
             return
 
         proxy_remark = self._remark_validation(remark)
 
         # Use registry to build node
-        handler = self.protocol_handlers.get(inbound.protocol)
+        handler = self._resolve_handler(self.protocol_handlers, inbound.protocol)
         if not handler:
             return
 
         node = handler(proxy_remark, address, inbound, settings)
         if node:
             self.data["proxies"].append(node)
-            self.proxy_remarks.append(proxy_remark)
+            self._add_remark(proxy_remark)
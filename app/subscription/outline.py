@@ -6,7 +6,10 @@ from .base import BaseSubscription
 
 
 class OutlineConfiguration(BaseSubscription):
+    __slots__ = ("config",)
+
     def __init__(self):
+        super().__init__()
         self.config = {}
 
     def add_directly(self, data: dict):
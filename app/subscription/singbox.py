@@ -1,6 +1,11 @@
+import copy
 import json
 import re
+from collections.abc import Mapping
+from functools import lru_cache
 from random import choice
+from types import MappingProxyType
+from typing import ClassVar
 
 from app.models.subscription import (
     GRPCTransportConfig,
@@ -14,7 +19,41 @@ from app.utils.helpers import UUIDEncoder
 from . import BaseSubscription
 
 
+@lru_cache(maxsize=64)
+def _load_template(template_content: str) -> dict:
+    # Parsed once per template; callers deepcopy it since the config is mutated while rendering
+    return json.loads(template_content)
+
+
+# Outbound types grouped under urltest; selectors additionally include the urltest groups
+_URLTEST_TYPES = frozenset(("vmess", "vless", "trojan", "shadowsocks", "hysteria2", "tuic", "http", "ssh"))
+
+
 class SingBoxConfiguration(BaseSubscription):
+    transport_handlers: ClassVar[Mapping[str, str]] = MappingProxyType(
+        {
+            "http": "_transport_http",
+            "ws": "_transport_ws",
+            "grpc": "_transport_grpc",
+            "gun": "_transport_grpc",
+            "httpupgrade": "_transport_httpupgrade",
+            "h2": "_transport_http",
+            "h3": "_transport_http",
+            "raw": "_transport_http",
+        }
+    )
+
+    protocol_handlers: ClassVar[Mapping[str, str]] = MappingProxyType(
+        {
+            "vmess": "_build_vmess",
+            "vless": "_build_vless",
+            "trojan": "_build_trojan",
+            "shadowsocks": "_build_shadowsocks",
+            "hysteria": "_build_hysteria",
+            "wireguard": "_build_wireguard",
+        }
+    )
+
     def __init__(
         self,
         singbox_template_content: str | None = None,
@@ -25,32 +64,10 @@ class SingBoxConfiguration(BaseSubscription):
             user_agent_template_content=user_agent_template_content,
             grpc_user_agent_template_content=grpc_user_agent_template_content,
         )
-        self.config = json.loads(singbox_template_content) if singbox_template_content else {}
+        self.config = copy.deepcopy(_load_template(singbox_template_content)) if singbox_template_content else {}
         self.config.setdefault("endpoints", [])
         self.config.setdefault("outbounds", [])
 
-        # Registry for transport handlers
-        self.transport_handlers = {
-            "http": self._transport_http,
-            "ws": self._transport_ws,
-            "grpc": self._transport_grpc,
-            "gun": self._transport_grpc,
-            "httpupgrade": self._transport_httpupgrade,
-            "h2": self._transport_http,
-            "h3": self._transport_http,
-            "raw": self._transport_http,
-        }
-
-        # Registry for protocol builders
-        self.protocol_handlers = {
-            "vmess": self._build_vmess,
-            "vless": self._build_vless,
-            "trojan": self._build_trojan,
-            "shadowsocks": self._build_shadowsocks,
-            "hysteria": self._build_hysteria,
-            "wireguard": self._build_wireguard,
-        }
-
     def add_outbound(self, outbound_data):
         self.config["outbounds"].append(outbound_data)
 
@@ -59,48 +76,48 @@ class SingBoxConfiguration(BaseSubscription):
 
     def render(self):
         self._finalize_config()
-        return json.dumps(self.config, indent=4, cls=UUIDEncoder)
+        # The config is a freshly built tree (shared tag lists are reused, never cyclic), so the
+        # per-container cycle bookkeeping is skipped
+        return json.dumps(self.config, indent=4, cls=UUIDEncoder, check_circular=False)
 
     def _finalize_config(self):
-        urltest_types = ["vmess", "vless", "trojan", "shadowsocks", "hysteria2", "tuic", "http", "ssh"]
-        urltest_tags = [outbound["tag"] for outbound in self.config["outbounds"] if outbound["type"] in urltest_types]
-        selector_types = [
-            "vmess",
-            "vless",
-            "trojan",
-            "shadowsocks",
-            "hysteria2",
-            "tuic",
-            "http",
-            "ssh",
-            "urltest",
-        ]
-        selector_tags = [outbound["tag"] for outbound in self.config["outbounds"] if outbound["type"] in selector_types]
+        urltest_tags = []
+        selector_tags = []
+        urltest_groups = []
+        selector_groups = []
+        for outbound in self.config["outbounds"]:
+            outbound_type = outbound["type"]
+            if outbound_type in _URLTEST_TYPES:
+                urltest_tags.append(outbound["tag"])
+                selector_tags.append(outbound["tag"])
+            elif outbound_type == "urltest":
+                selector_tags.append(outbound["tag"])
+                urltest_groups.append(outbound)
+            elif outbound_type == "selector":
+                selector_groups.append(outbound)
+
         endpoint_tags = [endpoint["tag"] for endpoint in self.config.get("endpoints", []) if endpoint.get("tag")]
         urltest_tags.extend(endpoint_tags)
         selector_tags.extend(endpoint_tags)
 
-        for outbound in self.config["outbounds"]:
-            if outbound.get("type") == "urltest":
-                outbound["outbounds"] = urltest_tags
-
-        for outbound in self.config["outbounds"]:
-            if outbound.get("type") == "selector":
-                outbound["outbounds"] = selector_tags
+        for outbound in urltest_groups:
+            outbound["outbounds"] = urltest_tags
+        for outbound in selector_groups:
+            outbound["outbounds"] = selector_tags
 
     def add(self, remark: str, address: str, inbound: SubscriptionInboundData, settings: dict):
         """Add outbound using registry pattern"""
         # Not supported by sing-box
-        if inbound.network in ("kcp", "splithttp", "xhttp"):
+        if inbound.network in {"kcp", "splithttp", "xhttp"}:
             return
         if inbound.network == "quic" and getattr(inbound.transport_config, "header_type", "none") != "none":
             return
 
         remark = self._remark_validation(remark)
-        self.proxy_remarks.append(remark)
+        self._add_remark(remark)
 
         # Get protocol handler from registry
-        handler = self.protocol_handlers.get(inbound.protocol)
+        handler = self._resolve_handler(self.protocol_handlers, inbound.protocol)
         if not handler:
             return
 
@@ -119,7 +136,7 @@ class SingBoxConfiguration(BaseSubscription):
         host = config.host if isinstance(config.host, str) else (config.host[0] if config.host else "")
 
         transport = {
-            "type": network if network in ("http", "h2", "h3") else "http",
+            "type": network if network in {"http", "h2", "h3"} else "http",
             "idle_timeout": "15s",
             "ping_timeout": "15s",
             "path": path,
@@ -145,77 +162,83 @@ class SingBoxConfiguration(BaseSubscription):
         # Parse early data from path
         max_early_data = None
         early_data_header_name = None
-        if "?ed=" in path:
-            path, ed_part = path.split("?ed=")
-            max_early_data = int(ed_part.split("/")[0])
+        head, sep, ed_part = path.partition("?ed=")
+        if sep:
+            path = head
+            max_early_data = int(ed_part.partition("/")[0])
             early_data_header_name = "Sec-WebSocket-Protocol"
 
-        transport = {
-            "type": "ws",
-            "headers": {k: [v] for k, v in config.http_headers.items()} if config.http_headers else {},
-            "path": path,
-            "max_early_data": max_early_data,
-            "early_data_header_name": early_data_header_name,
-        }
-        transport["headers"]["host"] = [host] if host else None
-
+        headers = {k: [v] for k, v in config.http_headers.items()} if config.http_headers else {}
+        if host:
+            headers["host"] = [host]
+        else:
+            headers.pop("host", None)
         if config.random_user_agent:
-            transport["headers"]["User-Agent"] = [choice(self.user_agent_list)]
-
-        return self._normalize_and_remove_none_values(transport)
+            headers["User-Agent"] = [choice(self.user_agent_list)]
+
+        # Fields are only set when non-empty, so no pruning pass is needed
+        transport = {"type": "ws"}
+        if headers:
+            transport["headers"] = headers
+        if path:
+            transport["path"] = path
+        if max_early_data:
+            transport["max_early_data"] = max_early_data
+        if early_data_header_name:
+            transport["early_data_header_name"] = early_data_header_name
+        return transport
 
     def _transport_grpc(self, config: GRPCTransportConfig, path: str) -> dict:
         """Handle GRPC transport - only gets GRPC config"""
-        return self._normalize_and_remove_none_values(
-            {
-                "type": "grpc",
-                "service_name": path,
-                "idle_timeout": f"{config.idle_timeout}s" if config.idle_timeout else "15s",
-                "ping_timeout": f"{config.health_check_timeout}s" if config.health_check_timeout else "15s",
-                "permit_without_stream": config.permit_without_stream,
-            }
-        )
+        transport = {"type": "grpc"}
+        if path:
+            transport["service_name"] = path
+        transport["idle_timeout"] = f"{config.idle_timeout}s" if config.idle_timeout else "15s"
+        transport["ping_timeout"] = f"{config.health_check_timeout}s" if config.health_check_timeout else "15s"
+        if config.permit_without_stream:
+            transport["permit_without_stream"] = config.permit_without_stream
+        return transport
 
     def _transport_httpupgrade(self, config: WebSocketTransportConfig, path: str) -> dict:
         """Handle HTTPUpgrade transport - only gets WS config (similar to WS)"""
         host = config.host if isinstance(config.host, str) else (config.host[0] if config.host else "")
-        if "?ed=" in path:
-            path, _ = path.split("?ed=")
-
-        transport = {
-            "type": "httpupgrade",
-            "headers": {k: [v] for k, v in config.http_headers.items()} if config.http_headers else {},
-            "host": host,
-            "path": path,
-        }
+        path = path.partition("?ed=")[0]
 
+        headers = {k: [v] for k, v in config.http_headers.items()} if config.http_headers else {}
         if config.random_user_agent:
-            transport["headers"]["User-Agent"] = [choice(self.user_agent_list)]
+            headers["User-Agent"] = [choice(self.user_agent_list)]
 
-        return self._normalize_and_remove_none_values(transport)
+        transport = {"type": "httpupgrade"}
+        if headers:
+            transport["headers"] = headers
+        if host:
+            transport["host"] = host
+        if path:
+            transport["path"] = path
+        return transport
 
     def _apply_transport(self, network: str, inbound: SubscriptionInboundData, path: str) -> dict | None:
         """Apply transport settings using registry pattern"""
-        # Map network types
-        if network in ("tcp", "raw") and getattr(inbound.transport_config, "header_type", "none") == "http":
+        if network in ("tcp", "raw"):
+            # For pure TCP connections without HTTP headers, don't add transport config
+            if getattr(inbound.transport_config, "header_type", "none") != "http":
+                return None
             network = "http"
 
-        # For pure TCP connections without HTTP headers, don't add transport config
-        if network in ("tcp", "raw") and getattr(inbound.transport_config, "header_type", "none") != "http":
-            return None
-
-        handler = self.transport_handlers.get(network)
+        handler = self._resolve_handler(self.transport_handlers, network)
         if not handler:
             return None
 
         # Pass only the config this transport needs
-        if network in ("http", "h2", "h3", "raw", "tcp"):
+        if network in {"http", "h2", "h3", "raw", "tcp"}:
             return handler(inbound.transport_config, path, network)
         else:
             return handler(inbound.transport_config, path)
 
-    def _apply_tls(self, tls_config: TLSConfig, fragment_settings: dict | None = None) -> dict:
-        """Apply TLS settings - receives TLS config and optional fragment settings"""
+    def _apply_tls(
+        self, tls_config: TLSConfig, fragment_settings: dict | None = None, alpn_override: list[str] | None = None
+    ) -> dict:
+        """Apply TLS settings - receives TLS config, optional fragment settings and ALPN override"""
         config = {
             "enabled": tls_config.tls in ("tls", "reality"),
             "server_name": tls_config.sni
@@ -231,7 +254,7 @@ class SingBoxConfiguration(BaseSubscription):
             }
             if tls_config.fingerprint or tls_config.tls == "reality"
             else None,
-            "alpn": tls_config.alpn_singbox,  # Pre-formatted for sing-box!
+            "alpn": alpn_override or tls_config.alpn_singbox,  # Pre-formatted for sing-box!
             "ech": {
                 "enabled": True,
                 "config": [],
@@ -413,14 +436,14 @@ class SingBoxConfiguration(BaseSubscription):
         if network in ("grpc", "gun"):
             path = self.get_grpc_gun(path)
 
-        # Map network aliases
+        # Map network aliases; h2/h3 pin the ALPN without touching the inbound's TLS config
+        alpn_override = None
         if network == "h2":
             network = "http"
-            # Override ALPN for h2
-            inbound.tls_config.alpn_list = ["h2"]
+            alpn_override = ["h2"]
         elif network == "h3":
             network = "http"
-            inbound.tls_config.alpn_list = ["h3"]
+            alpn_override = ["h3"]
 
         config = {
             "type": protocol_type,
@@ -431,14 +454,14 @@ class SingBoxConfiguration(BaseSubscription):
         }
 
         # Add transport
-        if network in ("http", "tcp", "raw", "ws", "quic", "grpc", "httpupgrade", "h2", "h3"):
+        if network in {"http", "tcp", "raw", "ws", "quic", "grpc", "httpupgrade", "h2", "h3"}:
             transport = self._apply_transport(network, inbound, path)
             if transport:
                 config["transport"] = transport
 
         # Add TLS
         if inbound.tls_config.tls in ("tls", "reality"):
-            config["tls"] = self._apply_tls(inbound.tls_config, inbound.fragment_settings)
+            config["tls"] = self._apply_tls(inbound.tls_config, inbound.fragment_settings, alpn_override)
 
         # Add mux
         if inbound.mux_settings and (singbox_mux := inbound.mux_settings.get("sing_box")) and singbox_mux.get("enable"):
@@ -466,13 +489,6 @@ class SingBoxConfiguration(BaseSubscription):
 
         return self._normalize_and_remove_none_values(config)
 
-    def _select_port(self, port: int | str) -> int:
-        """Select a random port if multiple are provided"""
-        if isinstance(port, str):
-            ports = port.split(",")
-            return int(choice(ports))
-        return port
-
     @staticmethod
     def _parse_wireguard_reserved(reserved: str | None) -> list[int] | None:
         """Parse WireGuard reserved bytes from common persisted string formats."""
@@ -7,8 +7,10 @@ from .base import BaseSubscription
 
 
 class WireGuardConfiguration(BaseSubscription):
+    __slots__ = ("configs",)
+
     def __init__(self):
-        self.proxy_remarks = []
+        super().__init__()
         self.configs: list[tuple[str, str]] = []
 
     def _render_config(self, config_dict: dict[str, dict[str, str]]) -> str:
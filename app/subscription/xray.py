@@ -638,13 +638,6 @@ class XrayConfiguration(BaseSubscription):
 
         return stream_settings
 
-    def _select_port(self, port: int | str) -> int:
-        """Select a random port if multiple are provided"""
-        if isinstance(port, str):
-            ports = port.split(",")
-            return int(choice(ports))
-        return port
-
     @staticmethod
     def _parse_wireguard_reserved(reserved: str | None) -> list[int] | None:
         """Parse WireGuard reserved bytes from common persisted string formats."""
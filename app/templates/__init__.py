@@ -1,7 +1,8 @@
 from datetime import datetime as dt, timezone as tz
+from functools import lru_cache
 from typing import Union
 
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import Environment, FileSystemLoader, Template
 from jinja2.sandbox import SandboxedEnvironment
 
 from config import template_settings
@@ -26,5 +27,12 @@ def render_template(template: str, context: Union[dict, None] = None) -> str:
     return env.get_template(template).render(context or {})
 
 
+@lru_cache(maxsize=64)
+def _compile_template_string(template_content: str) -> Template:
+    # Template contents come from the (cached) client templates, so the same few strings
+    # are rendered on every subscription request; compile each one only once.
+    return sandbox_env.from_string(template_content)
+
+
 def render_template_string(template_content: str, context: Union[dict, None] = None) -> str:
-    return sandbox_env.from_string(template_content).render(context or {})
+    return _compile_template_string(template_content).render(context or {})
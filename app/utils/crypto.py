@@ -1,5 +1,6 @@
 import base64
 import binascii
+from functools import lru_cache
 
 from cryptography import x509
 from cryptography.hazmat.backends import default_backend
@@ -7,7 +8,8 @@ from cryptography.hazmat.primitives import serialization
 from cryptography.hazmat.primitives.asymmetric import x25519
 
 
-def get_cert_SANs(cert: bytes):
+@lru_cache(maxsize=256)
+def _load_cert_SANs(cert: bytes) -> tuple:
     cert = x509.load_pem_x509_certificate(cert, default_backend())
     san_list = []
     for extension in cert.extensions:
@@ -15,15 +17,24 @@ def get_cert_SANs(cert: bytes):
             san = extension.value
             for name in san:
                 san_list.append(name.value)
-    return san_list
+    return tuple(san_list)
+
+
+def get_cert_SANs(cert: bytes):
+    # Parsed once per PEM; a fresh list is returned so callers may mutate it
+    return list(_load_cert_SANs(cert))
+
+
+# Padding to append, indexed by len % 4
+_BASE64_PADDING = ("", "===", "==", "=")
 
 
 def add_base64_padding(b64_string: str) -> str:
     """Adds missing Base64 padding if necessary."""
-    missing_padding = len(b64_string) % 4
-    return b64_string + ("=" * (4 - missing_padding)) if missing_padding else b64_string
+    return b64_string + _BASE64_PADDING[len(b64_string) & 3]
 
 
+@lru_cache(maxsize=256)
 def get_x25519_public_key(private_key_b64: str) -> str:
     """
     Converts an X25519 private key (URL-safe Base64) into a public key (URL-safe Base64 format).
@@ -71,6 +82,7 @@ def validate_wireguard_key(key_b64: str, field_name: str = "wireguard key") -> s
     return base64.b64encode(key_bytes).decode("ascii")
 
 
+@lru_cache(maxsize=4096)
 def get_wireguard_public_key(private_key_b64: str) -> str:
     normalized_private_key = validate_wireguard_key(private_key_b64, "wireguard private_key")
     private_key_bytes = base64.b64decode(normalized_private_key, validate=True)
@@ -1,7 +1,6 @@
-import html
 import json
-import re
 from datetime import datetime as dt, timezone as tz
+from functools import lru_cache
 from typing import Union
 from uuid import UUID
 
@@ -161,20 +160,39 @@ def format_validation_error(error: ValidationError) -> str:
     return "\n".join([e["loc"][0].replace("_", " ").capitalize() + ": " + e["msg"] for e in error.errors()])
 
 
+_TG_TRANS = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;", "'": "&#x27;"})
+
+# Other characters like >, |, [, ], (, ) are often handled by Discord's parser
+# or are part of specific markdown constructs (e.g., links, blockquotes)
+# that might not need general escaping.
+_DS_TRANS = str.maketrans({char: "\\" + char for char in "*_`~"})
+
+
+@lru_cache(maxsize=256)
+def _escape_tg_one(text: str) -> str:
+    return text.translate(_TG_TRANS)
+
+
+@lru_cache(maxsize=256)
+def _escape_ds_one(text: str) -> str:
+    return text.translate(_DS_TRANS)
+
+
+def escape_tg_html_text(text: str) -> str:
+    """Escapes a single string for the telegram HTML parser."""
+    return _escape_tg_one(text)
+
+
 def escape_tg_html(list: tuple[str]) -> tuple[str]:
     """Escapes HTML special characters for the telegram HTML parser."""
-    return tuple(html.escape(text) for text in list)
+    return tuple(_escape_tg_one(text) for text in list)
 
 
 def escape_ds_markdown(text: str) -> str:
     """Escapes markdown special characters for Discord."""
-    # Other characters like >, |, [, ], (, ) are often handled by Discord's parser
-    # or are part of specific markdown constructs (e.g., links, blockquotes)
-    # that might not need general escaping.
-    escape_chars = r"[*_`~]"
-    return re.sub(escape_chars, r"\\\g<0>", text)
+    return _escape_ds_one(text)
 
 
 def escape_ds_markdown_list(list: tuple[str]) -> tuple[str]:
     """Escapes markdown special characters for Discord."""
-    return tuple(escape_ds_markdown(text) for text in list)
+    return tuple(_escape_ds_one(text) for text in list)
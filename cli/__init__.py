@@ -4,6 +4,8 @@ PasarGuard CLI Package
 A modern, type-safe CLI built with Typer for managing PasarGuard instances.
 """
 
+from functools import cache
+
 from pydantic import ValidationError
 from rich.console import Console
 from rich.table import Table
@@ -22,11 +24,13 @@ SYSTEM_ADMIN = AdminDetails(
 )
 
 
+@cache
 def get_admin_operation() -> AdminOperation:
     """Get admin operation instance."""
     return AdminOperation(OperatorType.CLI)
 
 
+@cache
 def get_system_operation() -> SystemOperation:
     """Get node operation instance."""
     return SystemOperation(OperatorType.CLI)
@@ -14,10 +14,41 @@ from app.models.notification_enable import UserNotificationEnable
 from app.utils.system import readable_size
 from cli import SYSTEM_ADMIN, BaseCLI, console, get_admin_operation
 
+# User notification toggles, in prompt order, with their display labels
+NOTIFICATION_FIELDS = (
+    ("create", "User Create"),
+    ("modify", "User Modify"),
+    ("delete", "User Delete"),
+    ("status_change", "Status Change"),
+    ("reset_data_usage", "Reset Data Usage"),
+    ("data_reset_by_next", "Data Reset By Next"),
+    ("subscription_revoked", "Subscription Revoked"),
+)
+
 
 class AdminCLI(BaseCLI):
     """Admin CLI operations."""
 
+    def prompt_notification_enable(self, current: dict | None = None) -> UserNotificationEnable:
+        """Prompt for user notification preferences, defaulting to the current ones."""
+        current = current or {}
+        self.console.print("\n[cyan]Notification Preferences:[/cyan]")
+        enable_notifications = typer.confirm(
+            "Enable user notifications for this admin?",
+            default=any(current.get(field, False) for field, _ in NOTIFICATION_FIELDS),
+        )
+
+        if not enable_notifications:
+            return UserNotificationEnable(**{field: False for field, _ in NOTIFICATION_FIELDS})
+
+        self.console.print("[yellow]Select which notification types to enable:[/yellow]")
+        return UserNotificationEnable(
+            **{
+                field: typer.confirm(f"  {label}?", default=current.get(field, False))
+                for field, label in NOTIFICATION_FIELDS
+            }
+        )
+
     async def list_admins(self, db):
         """List all admin accounts."""
         admin_op = get_admin_operation()
@@ -52,50 +83,17 @@ class AdminCLI(BaseCLI):
         admin_op = get_admin_operation()
 
         # Check if admin already exists
-        admins = await admin_op.get_admins(db, AdminListQuery())
-        if any(admin.username == username for admin in admins):
+        if await admin_op.get_admin_by_username(db, username):
             self.console.print(f"[red]Admin '{username}' already exists[/red]")
             return
 
         while True:
             # Get password
-            password = typer.prompt("Password", hide_input=True)
-            if not password:
-                self.console.print("[red]Password is required[/red]")
-                continue
-
-            confirm_password = typer.prompt("Confirm Password", hide_input=True)
-            if password != confirm_password:
-                self.console.print("[red]Passwords do not match[/red]")
-                continue
+            password = typer.prompt("Password", hide_input=True, confirmation_prompt="Confirm Password")
 
             try:
                 # Notification preferences setup
-                self.console.print("\n[cyan]Notification Preferences:[/cyan]")
-                enable_notifications = typer.confirm("Enable user notifications for this admin?", default=False)
-
-                if enable_notifications:
-                    self.console.print("[yellow]Select which notification types to enable:[/yellow]")
-                    notif_create = typer.confirm("  User Create?", default=False)
-                    notif_modify = typer.confirm("  User Modify?", default=False)
-                    notif_delete = typer.confirm("  User Delete?", default=False)
-                    notif_status_change = typer.confirm("  Status Change?", default=False)
-                    notif_reset_data = typer.confirm("  Reset Data Usage?", default=False)
-                    notif_data_reset_by_next = typer.confirm("  Data Reset By Next?", default=False)
-                    notif_sub_revoked = typer.confirm("  Subscription Revoked?", default=False)
-                else:
-                    notif_create = notif_modify = notif_delete = notif_status_change = False
-                    notif_reset_data = notif_data_reset_by_next = notif_sub_revoked = False
-
-                notification_enable = UserNotificationEnable(
-                    create=notif_create,
-                    modify=notif_modify,
-                    delete=notif_delete,
-                    status_change=notif_status_change,
-                    reset_data_usage=notif_reset_data,
-                    data_reset_by_next=notif_data_reset_by_next,
-                    subscription_revoked=notif_sub_revoked,
-                )
+                notification_enable = self.prompt_notification_enable()
 
                 # Create admin
                 new_admin = AdminCreate(
@@ -116,13 +114,11 @@ class AdminCLI(BaseCLI):
         admin_op = get_admin_operation()
 
         # Check if admin exists
-        admins = await admin_op.get_admins(db, AdminListQuery())
-        target_admin = next((admin for admin in admins if admin.username == username), None)
-        if not target_admin:
+        row = await admin_op.get_admin_with_user_count(db, username)
+        if not row:
             self.console.print(f"[red]Admin '{username}' not found[/red]")
             return
-
-        user_count = len(target_admin.users or [])
+        target_admin, user_count = row
 
         if typer.confirm(f"Are you sure you want to delete admin '{username}'?"):
             if user_count > 0:
@@ -148,8 +144,7 @@ class AdminCLI(BaseCLI):
         """Delete all users belonging to an admin."""
         admin_op = get_admin_operation()
 
-        admins = await admin_op.get_admins(db, AdminListQuery())
-        target_admin = next((admin for admin in admins if admin.username == username), None)
+        target_admin = await admin_op.get_admin_by_username(db, username)
         if not target_admin:
             self.console.print(f"[red]Admin '{username}' not found[/red]")
             return
@@ -173,15 +168,12 @@ class AdminCLI(BaseCLI):
         """Modify an admin account."""
         admin_op = get_admin_operation()
 
-        # Check if admin exists
-        admins = await admin_op.get_admins(db, AdminListQuery())
-        if not any(admin.username == username for admin in admins):
+        # Check if admin exists and get the current admin details
+        current_admin = await admin_op.get_admin_by_username(db, username)
+        if not current_admin:
             self.console.print(f"[red]Admin '{username}' not found[/red]")
             return
 
-        # Get the current admin details
-        current_admin = next(admin for admin in admins if admin.username == username)
-
         self.console.print(f"[yellow]Modifying admin '{username}'[/yellow]")
         self.console.print("[cyan]Current settings:[/cyan]")
         self.console.print(f"  Username: {current_admin.username}")
@@ -194,13 +186,8 @@ class AdminCLI(BaseCLI):
         else:
             notif = current_admin.notification_enable
             self.console.print("  Notifications:")
-            self.console.print(f"    User Create: {'✓' if notif['create'] else '✗'}")
-            self.console.print(f"    User Modify: {'✓' if notif['modify'] else '✗'}")
-            self.console.print(f"    User Delete: {'✓' if notif['delete'] else '✗'}")
-            self.console.print(f"    Status Change: {'✓' if notif['status_change'] else '✗'}")
-            self.console.print(f"    Reset Data Usage: {'✓' if notif['reset_data_usage'] else '✗'}")
-            self.console.print(f"    Data Reset By Next: {'✓' if notif['data_reset_by_next'] else '✗'}")
-            self.console.print(f"    Subscription Revoked: {'✓' if notif['subscription_revoked'] else '✗'}")
+            for field, label in NOTIFICATION_FIELDS:
+                self.console.print(f"    {label}: {'✓' if notif[field] else '✗'}")
 
         new_password = None
         is_sudo = current_admin.is_sudo
@@ -209,11 +196,7 @@ class AdminCLI(BaseCLI):
 
         # Password modification
         if typer.confirm("Do you want to change the password?"):
-            new_password = typer.prompt("New password", hide_input=True)
-            confirm_password = typer.prompt("Confirm Password", hide_input=True)
-            if new_password != confirm_password:
-                self.console.print("[red]Passwords do not match[/red]")
-                return
+            new_password = typer.prompt("New password", hide_input=True, confirmation_prompt="Confirm Password")
 
         # Sudo status modification
         if typer.confirm(f"Do you want to change sudo status? (Current: {'✓' if current_admin.is_sudo else '✗'})"):
@@ -231,52 +214,7 @@ class AdminCLI(BaseCLI):
         if current_admin.notification_enable is not None and typer.confirm(
             "Do you want to modify notification preferences?"
         ):
-            self.console.print("\n[cyan]Notification Preferences:[/cyan]")
-            enable_notifications = typer.confirm(
-                "Enable user notifications for this admin?",
-                default=any(
-                    [
-                        current_admin.notification_enable["create"],
-                        current_admin.notification_enable["modify"],
-                        current_admin.notification_enable["delete"],
-                        current_admin.notification_enable["status_change"],
-                        current_admin.notification_enable["reset_data_usage"],
-                        current_admin.notification_enable["data_reset_by_next"],
-                        current_admin.notification_enable["subscription_revoked"],
-                    ]
-                ),
-            )
-
-            if enable_notifications:
-                self.console.print("[yellow]Select which notification types to enable:[/yellow]")
-                notif_create = typer.confirm("  User Create?", default=current_admin.notification_enable["create"])
-                notif_modify = typer.confirm("  User Modify?", default=current_admin.notification_enable["modify"])
-                notif_delete = typer.confirm("  User Delete?", default=current_admin.notification_enable["delete"])
-                notif_status_change = typer.confirm(
-                    "  Status Change?", default=current_admin.notification_enable["status_change"]
-                )
-                notif_reset_data = typer.confirm(
-                    "  Reset Data Usage?", default=current_admin.notification_enable["reset_data_usage"]
-                )
-                notif_data_reset_by_next = typer.confirm(
-                    "  Data Reset By Next?", default=current_admin.notification_enable["data_reset_by_next"]
-                )
-                notif_sub_revoked = typer.confirm(
-                    "  Subscription Revoked?", default=current_admin.notification_enable["subscription_revoked"]
-                )
-            else:
-                notif_create = notif_modify = notif_delete = notif_status_change = False
-                notif_reset_data = notif_data_reset_by_next = notif_sub_revoked = False
-
-            notification_enable = UserNotificationEnable(
-                create=notif_create,
-                modify=notif_modify,
-                delete=notif_delete,
-                status_change=notif_status_change,
-                reset_data_usage=notif_reset_data,
-                data_reset_by_next=notif_data_reset_by_next,
-                subscription_revoked=notif_sub_revoked,
-            )
+            notification_enable = self.prompt_notification_enable(current_admin.notification_enable)
 
         # Confirm changes
         self.console.print("\n[cyan]Summary of changes:[/cyan]")
@@ -310,14 +248,13 @@ class AdminCLI(BaseCLI):
         admin_op = get_admin_operation()
 
         # Check if admin exists
-        admins = await admin_op.get_admins(db, AdminListQuery())
-        if not any(admin.username == username for admin in admins):
+        target_admin = await admin_op.get_admin_by_username(db, username)
+        if not target_admin:
             self.console.print(f"[red]Admin '{username}' not found[/red]")
             return
 
         if typer.confirm(f"Are you sure you want to reset usage for admin '{username}'?"):
             try:
-                target_admin = next(admin for admin in admins if admin.username == username)
                 await admin_op.reset_admin_usage_by_id(db, target_admin.id, SYSTEM_ADMIN)
                 self.console.print(f"[green]Usage reset for admin '{username}'[/green]")
             except Exception as e:
@@ -101,6 +101,10 @@ class CorsSettings(EnvSettings):
     def allowed_origins(self) -> list[str]:
         return [origin.strip() for origin in self.allowed_origins_raw.split(",") if origin.strip()]
 
+    @cached_property
+    def allowed_origins_set(self) -> frozenset[str]:
+        return frozenset(self.allowed_origins)
+
 
 class SubscriptionEnvSettings(EnvSettings):
     xray_path: str = Field(default="", validation_alias="XRAY_SUBSCRIPTION_PATH")
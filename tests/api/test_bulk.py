@@ -21,18 +21,17 @@ from tests.api.helpers import (
 )
 
 
-def setup_groups(access_token: str, count: int = 1):
-    core = create_core(access_token)
-    groups = [create_group(access_token, name=unique_name(f"bulk_group_{idx}")) for idx in range(count)]
-    return core, groups
+def setup_groups(access_token: str, inbounds: list[str], count: int = 1) -> list[dict]:
+    return [
+        create_group(access_token, name=unique_name(f"bulk_group_{idx}"), inbound_tags=inbounds) for idx in range(count)
+    ]
 
 
-def cleanup(access_token: str, core: dict, groups: list[dict], users: list[dict]):
+def cleanup(access_token: str, groups: list[dict], users: list[dict]):
     for user in users:
         delete_user(access_token, user["username"])
     for group in groups:
         delete_group(access_token, group["id"])
-    delete_core(access_token, core["id"])
 
 
 def set_user_used_traffic(username: str, used_traffic: int) -> None:
@@ -71,10 +70,10 @@ def get_user_sub_revoked_at(username: str):
     return asyncio.run(_get_revoked_at())
 
 
-def test_add_groups_to_users(access_token):
+def test_add_groups_to_users(access_token, inbounds):
     """Test bulk adding groups to users."""
 
-    core, groups = setup_groups(access_token, 2)
+    groups = setup_groups(access_token, inbounds, 2)
     users = [create_user(access_token, payload={"username": unique_name("bulk_user")}) for _ in range(2)]
     group_ids = [group["id"] for group in groups]
     try:
@@ -85,16 +84,22 @@ def test_add_groups_to_users(access_token):
         )
 
         assert response.status_code == status.HTTP_200_OK
-        for user in users:
-            response = client.get(f"/api/user/{user['username']}", headers={"Authorization": f"Bearer {access_token}"})
-            assert set(response.json()["group_ids"]) == set(group_ids)
+        response = client.get(
+            "/api/users",
+            headers={"Authorization": f"Bearer {access_token}"},
+            params={"username": [user["username"] for user in users]},
+        )
+        listed = response.json()["users"]
+        assert len(listed) == len(users)
+        for user in listed:
+            assert set(user["group_ids"]) == set(group_ids)
     finally:
-        cleanup(access_token, core, groups, users)
+        cleanup(access_token, groups, users)
 
 
-def test_remove_groups_from_users(access_token):
+def test_remove_groups_from_users(access_token, inbounds):
     """Test bulk removing groups from users."""
-    core, groups = setup_groups(access_token, 2)
+    groups = setup_groups(access_token, inbounds, 2)
     users = [create_user(access_token, payload={"username": unique_name("bulk_user_remove")}) for _ in range(2)]
     group_ids = [group["id"] for group in groups]
     try:
@@ -110,16 +115,22 @@ def test_remove_groups_from_users(access_token):
         )
 
         assert response.status_code == status.HTTP_200_OK
-        for user in users:
-            response = client.get(f"/api/user/{user['username']}", headers={"Authorization": f"Bearer {access_token}"})
-            assert set(response.json()["group_ids"]) == {group_ids[1]}
+        response = client.get(
+            "/api/users",
+            headers={"Authorization": f"Bearer {access_token}"},
+            params={"username": [user["username"] for user in users]},
+        )
+        listed = response.json()["users"]
+        assert len(listed) == len(users)
+        for user in listed:
+            assert set(user["group_ids"]) == {group_ids[1]}
     finally:
-        cleanup(access_token, core, groups, users)
+        cleanup(access_token, groups, users)
 
 
-def test_update_users_datalimit(access_token):
+def test_update_users_datalimit(access_token, inbounds):
     """Test bulk updating user data limits."""
-    core, groups = setup_groups(access_token, 1)
+    groups = setup_groups(access_token, inbounds, 1)
     users = [
         create_user(
             access_token, group_ids=[groups[0]["id"]], payload={"username": unique_name("user7"), "data_limit": 100}
@@ -140,17 +151,21 @@ def test_update_users_datalimit(access_token):
         )
 
         assert response.status_code == status.HTTP_200_OK
-        response = client.get("/api/users", headers={"Authorization": f"Bearer {access_token}"})
-        listed = {u["id"]: u for u in response.json()["users"] if u["id"] in user_ids}
+        response = client.get(
+            "/api/users",
+            headers={"Authorization": f"Bearer {access_token}"},
+            params={"username": [user["username"] for user in users]},
+        )
+        listed = {u["id"]: u for u in response.json()["users"]}
         assert listed[users[0]["id"]]["data_limit"] == 150
         assert listed[users[1]["id"]]["data_limit"] == 250
     finally:
-        cleanup(access_token, core, groups, users)
+        cleanup(access_token, groups, users)
 
 
-def test_update_users_expire(access_token):
+def test_update_users_expire(access_token, inbounds):
     """Test bulk updating user expiration dates."""
-    core, groups = setup_groups(access_token, 1)
+    groups = setup_groups(access_token, inbounds, 1)
     users = [
         create_user(access_token, group_ids=[groups[0]["id"]], payload={"username": unique_name("user_expire1")}),
         create_user(access_token, group_ids=[groups[0]["id"]], payload={"username": unique_name("user_expire2")}),
@@ -174,12 +189,12 @@ def test_update_users_expire(access_token):
         )
 
         assert response.status_code == status.HTTP_200_OK
-        response = client.get("/api/users", headers={"Authorization": f"Bearer {access_token}"})
-        listed = {
-            u["username"]: u
-            for u in response.json()["users"]
-            if u["username"] in {users[0]["username"], users[1]["username"]}
-        }
+        response = client.get(
+            "/api/users",
+            headers={"Authorization": f"Bearer {access_token}"},
+            params={"username": [user["username"] for user in users]},
+        )
+        listed = {u["username"]: u for u in response.json()["users"]}
         assert (
             dt.fromisoformat(listed[users[0]["username"]]["expire"]).replace(tzinfo=None).strftime("%Y-%m-%dT%H:%M:%S")
             == "2025-01-01T01:00:00"
@@ -189,12 +204,12 @@ def test_update_users_expire(access_token):
             == "2026-01-01T01:00:00"
         )
     finally:
-        cleanup(access_token, core, groups, users)
+        cleanup(access_token, groups, users)
 
 
-def test_update_users_proxy_settings(access_token):
+def test_update_users_proxy_settings(access_token, inbounds):
     """Test bulk updating user proxy settings."""
-    core, groups = setup_groups(access_token, 1)
+    groups = setup_groups(access_token, inbounds, 1)
     users = [
         create_user(access_token, group_ids=[groups[0]["id"]], payload={"username": unique_name("user_proxy1")}),
         create_user(access_token, group_ids=[groups[0]["id"]], payload={"username": unique_name("user_proxy2")}),
@@ -207,22 +222,21 @@ def test_update_users_proxy_settings(access_token):
         )
 
         assert response.status_code == status.HTTP_200_OK
-        response = client.get("/api/users", headers={"Authorization": f"Bearer {access_token}"})
-        listed = {
-            u["username"]: u
-            for u in response.json()["users"]
-            if u["username"] in {users[0]["username"], users[1]["username"]}
-        }
+        response = client.get(
+            "/api/users",
+            headers={"Authorization": f"Bearer {access_token}"},
+            params={"username": [user["username"] for user in users]},
+        )
+        listed = {u["username"]: u for u in response.json()["users"]}
         assert listed[users[0]["username"]]["proxy_settings"]["shadowsocks"]["method"] == "xchacha20-poly1305"
         assert listed[users[1]["username"]]["proxy_settings"]["shadowsocks"]["method"] == "xchacha20-poly1305"
     finally:
-        cleanup(access_token, core, groups, users)
+        cleanup(access_token, groups, users)
 
 
-def test_bulk_expire_with_range(access_token):
+def test_bulk_expire_with_range(access_token, inbounds):
     # Setup
-    core = create_core(access_token)
-    group = create_group(access_token, name=unique_name("bulk_range_group"))
+    group = create_group(access_token, name=unique_name("bulk_range_group"), inbound_tags=inbounds)
 
     # Create two users, both expired, but at different times
     # User 1: expired 2 days ago
@@ -280,12 +294,10 @@ def test_bulk_expire_with_range(access_token):
         delete_user(access_token, user1["username"])
         delete_user(access_token, user2["username"])
         delete_group(access_token, group["id"])
-        delete_core(access_token, core["id"])
 
 
-def test_bulk_data_limit_with_expire_range_without_expired_status(access_token):
-    core = create_core(access_token)
-    group = create_group(access_token, name=unique_name("bulk_data_range_group"))
+def test_bulk_data_limit_with_expire_range_without_expired_status(access_token, inbounds):
+    group = create_group(access_token, name=unique_name("bulk_data_range_group"), inbound_tags=inbounds)
 
     now = dt.now(tz.utc).replace(microsecond=0)
     expire1 = now - td(days=2)
@@ -337,7 +349,6 @@ def test_bulk_data_limit_with_expire_range_without_expired_status(access_token):
         delete_user(access_token, user1["username"])
         delete_user(access_token, user2["username"])
         delete_group(access_token, group["id"])
-        delete_core(access_token, core["id"])
 
 
 def test_bulk_expire_dry_run(access_token):
@@ -353,8 +364,8 @@ def test_bulk_expire_dry_run(access_token):
     assert "affected_users" in data
 
 
-def test_bulk_delete_users_by_ids(access_token):
-    core, groups = setup_groups(access_token, 1)
+def test_bulk_delete_users_by_ids(access_token, inbounds):
+    groups = setup_groups(access_token, inbounds, 1)
     users = [
         create_user(access_token, group_ids=[groups[0]["id"]], payload={"username": unique_name("bulk_delete")})
         for _ in range(2)
@@ -378,11 +389,11 @@ def test_bulk_delete_users_by_ids(access_token):
         assert lookup.status_code == status.HTTP_200_OK
         assert lookup.json()["users"] == []
     finally:
-        cleanup(access_token, core, groups, [])
+        cleanup(access_token, groups, [])
 
 
-def test_bulk_reset_users_usage_by_ids(access_token):
-    core, groups = setup_groups(access_token, 1)
+def test_bulk_reset_users_usage_by_ids(access_token, inbounds):
+    groups = setup_groups(access_token, inbounds, 1)
     users = [
         create_user(access_token, group_ids=[groups[0]["id"]], payload={"username": unique_name("bulk_reset")})
         for _ in range(2)
@@ -409,11 +420,11 @@ def test_bulk_reset_users_usage_by_ids(access_token):
             assert user_response.status_code == status.HTTP_200_OK
             assert user_response.json()["used_traffic"] == 0
     finally:
-        cleanup(access_token, core, groups, users)
+        cleanup(access_token, groups, users)
 
 
-def test_bulk_revoke_users_subscription_by_ids(access_token):
-    core, groups = setup_groups(access_token, 1)
+def test_bulk_revoke_users_subscription_by_ids(access_token, inbounds):
+    groups = setup_groups(access_token, inbounds, 1)
     users = [
         create_user(access_token, group_ids=[groups[0]["id"]], payload={"username": unique_name("bulk_revoke")})
         for _ in range(2)
@@ -431,11 +442,11 @@ def test_bulk_revoke_users_subscription_by_ids(access_token):
         for user in users:
             assert get_user_sub_revoked_at(user["username"]) is not None
     finally:
-        cleanup(access_token, core, groups, users)
+        cleanup(access_token, groups, users)
 
 
-def test_bulk_disable_users_by_ids(access_token):
-    core, groups = setup_groups(access_token, 1)
+def test_bulk_disable_users_by_ids(access_token, inbounds):
+    groups = setup_groups(access_token, inbounds, 1)
     users = [
         create_user(access_token, group_ids=[groups[0]["id"]], payload={"username": unique_name("bulk_disable")})
         for _ in range(2)
@@ -459,11 +470,11 @@ def test_bulk_disable_users_by_ids(access_token):
             assert user_response.status_code == status.HTTP_200_OK
             assert user_response.json()["status"] == "disabled"
     finally:
-        cleanup(access_token, core, groups, users)
+        cleanup(access_token, groups, users)
 
 
-def test_bulk_enable_users_by_ids(access_token):
-    core, groups = setup_groups(access_token, 1)
+def test_bulk_enable_users_by_ids(access_token, inbounds):
+    groups = setup_groups(access_token, inbounds, 1)
     users = [
         create_user(access_token, group_ids=[groups[0]["id"]], payload={"username": unique_name("bulk_enable")})
         for _ in range(2)
@@ -494,11 +505,11 @@ def test_bulk_enable_users_by_ids(access_token):
             assert user_response.status_code == status.HTTP_200_OK
             assert user_response.json()["status"] == "active"
     finally:
-        cleanup(access_token, core, groups, users)
+        cleanup(access_token, groups, users)
 
 
-def test_bulk_disable_enable_users_ignore_noops(access_token):
-    core, groups = setup_groups(access_token, 1)
+def test_bulk_disable_enable_users_ignore_noops(access_token, inbounds):
+    groups = setup_groups(access_token, inbounds, 1)
     users = [
         create_user(access_token, group_ids=[groups[0]["id"]], payload={"username": unique_name("bulk_noop")})
         for _ in range(2)
@@ -537,11 +548,11 @@ def test_bulk_disable_enable_users_ignore_noops(access_token):
         assert enable_again_response.status_code == status.HTTP_200_OK
         assert enable_again_response.json()["count"] == 0
     finally:
-        cleanup(access_token, core, groups, users)
+        cleanup(access_token, groups, users)
 
 
-def test_bulk_set_owner_by_ids(access_token):
-    core, groups = setup_groups(access_token, 1)
+def test_bulk_set_owner_by_ids(access_token, inbounds):
+    groups = setup_groups(access_token, inbounds, 1)
     users = [
         create_user(access_token, group_ids=[groups[0]["id"]], payload={"username": unique_name("bulk_owner")})
         for _ in range(2)
@@ -566,7 +577,7 @@ def test_bulk_set_owner_by_ids(access_token):
             assert user_response.status_code == status.HTTP_200_OK
             assert user_response.json()["admin"]["username"] == new_owner["username"]
     finally:
-        cleanup(access_token, core, groups, users)
+        cleanup(access_token, groups, users)
         delete_admin(access_token, new_owner["username"])
 
 
@@ -658,4 +669,5 @@ def test_bulk_wireguard_reallocate_peer_ips_repairs_duplicates(access_token):
         assert second_peer_ips[0].startswith("10.")
         assert second_peer_ips[0].endswith("/32")
     finally:
-        cleanup(access_token, core, [group], users)
+        cleanup(access_token, [group], users)
+        delete_core(access_token, core["id"])
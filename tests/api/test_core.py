@@ -62,14 +62,15 @@ def test_core_update(access_token):
         params={"restart_nodes": False},
     )
     assert response.status_code == status.HTTP_200_OK
-    assert response.json()["config"] == xray_config
-    assert response.json()["name"] == "xray_config_update"
-    for v in response.json()["exclude_inbound_tags"]:
+    data = response.json()
+    assert data["config"] == xray_config
+    assert data["name"] == "xray_config_update"
+    for v in data["exclude_inbound_tags"]:
         assert v in {"Exclude"}
-    for v in response.json()["fallbacks_inbound_tags"]:
+    for v in data["fallbacks_inbound_tags"]:
         assert v in {"fallback-A", "fallback-B", "fallback-C", "fallback-D"}
-    assert len(response.json()["fallbacks_inbound_tags"]) == 4
-    assert len(response.json()["exclude_inbound_tags"]) == 1
+    assert len(data["fallbacks_inbound_tags"]) == 4
+    assert len(data["exclude_inbound_tags"]) == 1
     delete_core(access_token, core["id"])
 
 
@@ -82,7 +83,8 @@ def test_core_get(access_token):
         headers={"Authorization": f"Bearer {access_token}"},
     )
     assert response.status_code == status.HTTP_200_OK
-    assert response.json()["config"] == xray_config
+    data = response.json()
+    assert data["config"] == xray_config
     delete_core(access_token, core["id"])
 
 
@@ -1,16 +1,15 @@
 import random
 
+import pytest
 from fastapi import status
 
 from tests.api import client
-from tests.api.helpers import create_core, delete_core, create_group, delete_group, get_inbounds, unique_name
+from tests.api.helpers import create_group, delete_group, unique_name
 
 
-def test_group_create(access_token):
+def test_group_create(access_token, inbounds):
     """Test that the group create route is accessible."""
 
-    core = create_core(access_token)
-    inbounds = get_inbounds(access_token)
     assert inbounds, "Expected at least one inbound tag"
     created_groups = []
     try:
@@ -24,13 +23,12 @@ def test_group_create(access_token):
     finally:
         for group_id in created_groups:
             delete_group(access_token, group_id)
-        delete_core(access_token, core["id"])
 
 
+@pytest.mark.usefixtures("shared_core")
 def test_group_update(access_token):
     """Test that the group update route is accessible."""
 
-    core = create_core(access_token)
     group = create_group(access_token)
     response = client.put(
         url=f"/api/group/{group['id']}",
@@ -38,29 +36,28 @@ def test_group_update(access_token):
         json={"name": "testgroup4", "is_disabled": True},
     )
     assert response.status_code == status.HTTP_200_OK
-    assert response.json()["name"] == "testgroup4"
-    assert response.json()["is_disabled"] is True
+    data = response.json()
+    assert data["name"] == "testgroup4"
+    assert data["is_disabled"] is True
     delete_group(access_token, group["id"])
-    delete_core(access_token, core["id"])
 
 
+@pytest.mark.usefixtures("shared_core")
 def test_group_delete(access_token):
     """Test that the group delete route is accessible."""
 
-    core = create_core(access_token)
     group = create_group(access_token)
     response = client.delete(
         url=f"/api/group/{group['id']}",
         headers={"Authorization": f"Bearer {access_token}"},
     )
     assert response.status_code == status.HTTP_204_NO_CONTENT
-    delete_core(access_token, core["id"])
 
 
+@pytest.mark.usefixtures("shared_core")
 def test_group_get_by_id(access_token):
     """Test that the group get by id route is accessible."""
 
-    core = create_core(access_token)
     group = create_group(access_token, name="testgroup_lookup")
     response = client.get(
         url=f"/api/group/{group['id']}",
@@ -69,13 +66,12 @@ def test_group_get_by_id(access_token):
     assert response.status_code == status.HTTP_200_OK
     assert response.json()["name"] == "testgroup_lookup"
     delete_group(access_token, group["id"])
-    delete_core(access_token, core["id"])
 
 
+@pytest.mark.usefixtures("shared_core")
 def test_groups_get(access_token):
     """Test that the group get route is accessible."""
 
-    core = create_core(access_token)
     group_one = create_group(access_token, name="testgroup_total_1")
     group_two = create_group(access_token, name="testgroup_total_2")
     response = client.get(
@@ -88,15 +84,14 @@ def test_groups_get(access_token):
     assert "testgroup_total_2" in names
     delete_group(access_token, group_one["id"])
     delete_group(access_token, group_two["id"])
-    delete_core(access_token, core["id"])
 
 
 # Tests for /api/groups/simple endpoint
 
 
+@pytest.mark.usefixtures("shared_core")
 def test_get_groups_simple_basic(access_token):
     """Test that groups/simple returns correct minimal data structure."""
-    core = create_core(access_token)
     created_group_ids = []
     try:
         # Create 3 groups
@@ -127,12 +122,11 @@ def test_get_groups_simple_basic(access_token):
     finally:
         for gid in created_group_ids:
             delete_group(access_token, gid)
-        delete_core(access_token, core["id"])
 
 
+@pytest.mark.usefixtures("shared_core")
 def test_get_groups_simple_search(access_token):
     """Test case-insensitive search by group name."""
-    core = create_core(access_token)
     created_group_ids = []
     try:
         # Create 3 groups with specific names
@@ -156,12 +150,11 @@ def test_get_groups_simple_search(access_token):
     finally:
         for gid in created_group_ids:
             delete_group(access_token, gid)
-        delete_core(access_token, core["id"])
 
 
+@pytest.mark.usefixtures("shared_core")
 def test_get_groups_simple_sort_ascending(access_token):
     """Test ascending sort by name."""
-    core = create_core(access_token)
     created_group_ids = []
     try:
         # Create 3 groups with specific names for ordering
@@ -188,12 +181,11 @@ def test_get_groups_simple_sort_ascending(access_token):
     finally:
         for gid in created_group_ids:
             delete_group(access_token, gid)
-        delete_core(access_token, core["id"])
 
 
+@pytest.mark.usefixtures("shared_core")
 def test_get_groups_simple_sort_descending(access_token):
     """Test descending sort by name."""
-    core = create_core(access_token)
     created_group_ids = []
     try:
         # Create 3 groups with specific names for ordering
@@ -220,12 +212,11 @@ def test_get_groups_simple_sort_descending(access_token):
     finally:
         for gid in created_group_ids:
             delete_group(access_token, gid)
-        delete_core(access_token, core["id"])
 
 
+@pytest.mark.usefixtures("shared_core")
 def test_get_groups_simple_pagination(access_token):
     """Test pagination with offset and limit."""
-    core = create_core(access_token)
     created_group_ids = []
     try:
         # Create 5 groups
@@ -263,12 +254,11 @@ def test_get_groups_simple_pagination(access_token):
     finally:
         for gid in created_group_ids:
             delete_group(access_token, gid)
-        delete_core(access_token, core["id"])
 
 
+@pytest.mark.usefixtures("shared_core")
 def test_get_groups_simple_skip_pagination(access_token):
     """Test all=true parameter returns all records."""
-    core = create_core(access_token)
     created_group_ids = []
     try:
         # Create 10 groups
@@ -292,12 +282,11 @@ def test_get_groups_simple_skip_pagination(access_token):
     finally:
         for gid in created_group_ids:
             delete_group(access_token, gid)
-        delete_core(access_token, core["id"])
 
 
+@pytest.mark.usefixtures("shared_core")
 def test_get_groups_simple_empty_search(access_token):
     """Test search with no matching results."""
-    core = create_core(access_token)
     group = create_group(access_token, name="known_group_search")
     try:
         # Execute search for non-existent group
@@ -314,7 +303,6 @@ def test_get_groups_simple_empty_search(access_token):
         assert len(data["groups"]) == 0
     finally:
         delete_group(access_token, group["id"])
-        delete_core(access_token, core["id"])
 
 
 def test_get_groups_simple_invalid_sort(access_token):
@@ -330,9 +318,9 @@ def test_get_groups_simple_invalid_sort(access_token):
     assert response.status_code == status.HTTP_400_BAD_REQUEST
 
 
+@pytest.mark.usefixtures("shared_core")
 def test_get_groups_simple_search_and_sort(access_token):
     """Test combining search and sort parameters."""
-    core = create_core(access_token)
     created_group_ids = []
     try:
         # Create 4 groups
@@ -363,4 +351,3 @@ def test_get_groups_simple_search_and_sort(access_token):
     finally:
         for gid in created_group_ids:
             delete_group(access_token, gid)
-        delete_core(access_token, core["id"])
@@ -8,16 +8,13 @@ from tests.api.helpers import (
     create_core,
     delete_client_template,
     delete_core,
-    get_inbounds,
     unique_name,
 )
 
 
-def test_host_create(access_token):
+def test_host_create(access_token, inbounds):
     """Test that the host create route is accessible."""
 
-    core = create_core(access_token)
-    inbounds = get_inbounds(access_token)
     assert inbounds, "No inbounds available for host creation"
     created_hosts = []
 
@@ -38,25 +35,23 @@ def test_host_create(access_token):
                 json=payload,
             )
             assert response.status_code == status.HTTP_201_CREATED
-            created_hosts.append(response.json()["id"])
-            assert response.json()["remark"] == payload["remark"]
-            assert response.json()["address"] == payload["address"]
-            assert response.json()["port"] == payload["port"]
-            assert response.json()["sni"] == payload["sni"]
-            assert response.json()["inbound_tag"] == inbound
+            data = response.json()
+            created_hosts.append(data["id"])
+            assert data["remark"] == payload["remark"]
+            assert data["address"] == payload["address"]
+            assert data["port"] == payload["port"]
+            assert data["sni"] == payload["sni"]
+            assert data["inbound_tag"] == inbound
     finally:
         for host_id in created_hosts:
             client.delete(f"/api/host/{host_id}", headers={"Authorization": f"Bearer {access_token}"})
-        delete_core(access_token, core["id"])
 
 
-def test_host_get(access_token):
+def test_host_get(access_token, inbounds):
     """Test that the host get route is accessible."""
 
-    core = create_core(access_token)
-    inbound_list = get_inbounds(access_token)
-    assert inbound_list, "No inbounds available for host reads"
-    inbound = inbound_list[0]
+    assert inbounds, "No inbounds available for host reads"
+    inbound = inbounds[0]
     payload = {
         "remark": unique_name("test_host_get"),
         "address": ["127.0.0.1"],
@@ -74,16 +69,13 @@ def test_host_get(access_token):
     assert response.status_code == status.HTTP_200_OK
     assert any(host["remark"] == payload["remark"] for host in response.json())
     client.delete(f"/api/host/{host_id}", headers={"Authorization": f"Bearer {access_token}"})
-    delete_core(access_token, core["id"])
 
 
-def test_host_update(access_token):
+def test_host_update(access_token, inbounds):
     """Test that the host update route is accessible."""
 
-    core = create_core(access_token)
-    inbound_list = get_inbounds(access_token)
-    assert inbound_list, "No inbounds available for host updates"
-    inbound = inbound_list[0]
+    assert inbounds, "No inbounds available for host updates"
+    inbound = inbounds[0]
     create_response = client.post(
         "/api/host",
         headers={"Authorization": f"Bearer {access_token}"},
@@ -110,23 +102,21 @@ def test_host_update(access_token):
         },
     )
     assert response.status_code == status.HTTP_200_OK
-    assert response.json()["remark"] == "test_host_updated"
-    assert response.json()["address"] == ["127.0.0.2"]
-    assert response.json()["port"] == 443
-    assert response.json()["sni"] == ["test_sni_updated.com"]
-    assert response.json()["priority"] == 666
-    assert response.json()["inbound_tag"] == "Trojan Websocket TLS"
+    data = response.json()
+    assert data["remark"] == "test_host_updated"
+    assert data["address"] == ["127.0.0.2"]
+    assert data["port"] == 443
+    assert data["sni"] == ["test_sni_updated.com"]
+    assert data["priority"] == 666
+    assert data["inbound_tag"] == "Trojan Websocket TLS"
     client.delete(f"/api/host/{host_id}", headers={"Authorization": f"Bearer {access_token}"})
-    delete_core(access_token, core["id"])
 
 
-def test_host_delete(access_token):
+def test_host_delete(access_token, inbounds):
     """Test that the host delete route is accessible."""
 
-    core = create_core(access_token)
-    inbound_list = get_inbounds(access_token)
-    assert inbound_list, "No inbounds available for host deletion"
-    inbound = inbound_list[0]
+    assert inbounds, "No inbounds available for host deletion"
+    inbound = inbounds[0]
     create_response = client.post(
         "/api/host",
         headers={"Authorization": f"Bearer {access_token}"},
@@ -145,7 +135,6 @@ def test_host_delete(access_token):
         headers={"Authorization": f"Bearer {access_token}"},
     )
     assert response.status_code == status.HTTP_204_NO_CONTENT
-    delete_core(access_token, core["id"])
 
 
 def test_wireguard_host_create(access_token):
@@ -177,9 +166,10 @@ def test_wireguard_host_create(access_token):
             },
         )
         assert response.status_code == status.HTTP_201_CREATED
-        assert response.json()["inbound_tag"] == interface_name
-        assert response.json()["address"] == ["198.51.100.10"]
-        assert response.json()["port"] == 51820
+        data = response.json()
+        assert data["inbound_tag"] == interface_name
+        assert data["address"] == ["198.51.100.10"]
+        assert data["port"] == 51820
     finally:
         hosts_response = client.get("/api/hosts", headers={"Authorization": f"Bearer {access_token}"})
         if hosts_response.status_code == status.HTTP_200_OK:
@@ -189,11 +179,9 @@ def test_wireguard_host_create(access_token):
         delete_core(access_token, core["id"])
 
 
-def test_host_subscription_templates_create_and_update(access_token):
-    core = create_core(access_token)
-    inbound_list = get_inbounds(access_token)
-    assert inbound_list, "No inbounds available for host template override test"
-    inbound = inbound_list[0]
+def test_host_subscription_templates_create_and_update(access_token, inbounds):
+    assert inbounds, "No inbounds available for host template override test"
+    inbound = inbounds[0]
     first_template = create_client_template(
         access_token,
         name=unique_name("host_xray_template_first"),
@@ -223,8 +211,9 @@ def test_host_subscription_templates_create_and_update(access_token):
             },
         )
         assert create_response.status_code == status.HTTP_201_CREATED
-        host_id = create_response.json()["id"]
-        assert create_response.json()["subscription_templates"] == {"xray": first_template["id"]}
+        data = create_response.json()
+        host_id = data["id"]
+        assert data["subscription_templates"] == {"xray": first_template["id"]}
 
         update_response = client.put(
             f"/api/host/{host_id}",
@@ -246,7 +235,6 @@ def test_host_subscription_templates_create_and_update(access_token):
             client.delete(f"/api/host/{host_id}", headers=auth_headers(access_token))
         delete_client_template(access_token, second_template["id"])
         delete_client_template(access_token, first_template["id"])
-        delete_core(access_token, core["id"])
 
 
 # Tests for /api/hosts/simple endpoint
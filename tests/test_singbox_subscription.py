@@ -0,0 +1,58 @@
+import json
+
+import pytest
+
+from app.models.subscription import SubscriptionInboundData, TCPTransportConfig, TLSConfig
+from app.subscription.singbox import SingBoxConfiguration
+
+
+def _inbound(network: str) -> SubscriptionInboundData:
+    return SubscriptionInboundData(
+        remark=f"{network} inbound",
+        inbound_tag=f"{network}-tag",
+        protocol="vless",
+        address="example.com",
+        port=443,
+        network=network,
+        tls_config=TLSConfig(tls="tls", sni="example.com", alpn_list=["h2", "http/1.1"]),
+        transport_config=TCPTransportConfig(path="/", host=["example.com"]),
+    )
+
+
+@pytest.mark.parametrize("network", ["h2", "h3"])
+def test_http_transport_alpn_does_not_mutate_inbound(network: str):
+    inbound = _inbound(network)
+    config = SingBoxConfiguration()
+
+    config.add(
+        remark=inbound.remark,
+        address=inbound.address,
+        inbound=inbound,
+        settings={"id": "c90cff8e-d651-414e-8e83-1a187622d957"},
+    )
+    outbounds = json.loads(config.render())["outbounds"]
+
+    assert inbound.tls_config.alpn_list == ["h2", "http/1.1"]
+    outbound = next(o for o in outbounds if o.get("tag") == inbound.remark)
+    assert outbound["tls"]["alpn"] == [network]
+
+
+def test_http_transport_alpn_is_per_outbound():
+    h2_inbound = _inbound("h2")
+    h3_inbound = _inbound("h3")
+    # Both inbounds share one TLS config, as hosts on the same inbound do
+    h3_inbound.tls_config = h2_inbound.tls_config
+    config = SingBoxConfiguration()
+
+    for inbound in (h2_inbound, h3_inbound):
+        config.add(
+            remark=inbound.remark,
+            address=inbound.address,
+            inbound=inbound,
+            settings={"id": "c90cff8e-d651-414e-8e83-1a187622d957"},
+        )
+    outbounds = {o.get("tag"): o for o in json.loads(config.render())["outbounds"]}
+
+    assert h2_inbound.tls_config.alpn_list == ["h2", "http/1.1"]
+    assert outbounds[h2_inbound.remark]["tls"]["alpn"] == ["h2"]
+    assert outbounds[h3_inbound.remark]["tls"]["alpn"] == ["h3"]
@@ -10,6 +10,7 @@ from textual.widgets import Button, DataTable, Input, Static, Switch, TextArea
 
 from app.db import AsyncSession
 from app.db.base import get_db
+from app.db.crud.user import get_users_count
 from app.db.models import Admin, User
 from app.models.admin import AdminCreate, AdminDetails, AdminListQuery, AdminModify
 from app.models.notification_enable import UserNotificationEnable
@@ -745,11 +746,17 @@ class AdminContent(Static):
     def selected_admin_id(self) -> int:
         return int(self.table.coordinate_to_cell_key(Coordinate(self.table.cursor_row, 0)).row_key.value)
 
+    async def _selected_admin_with_user_count(self) -> tuple[Admin, int]:
+        admin = await self.admin_operator.get_validated_admin_by_id(
+            self.db, self.selected_admin_id, load_users=False, load_usage_logs=False
+        )
+        user_count = await get_users_count(self.db, admin_id=admin.id)
+        return admin, user_count
+
     async def action_delete_admin(self):
         if not self.table.columns:
             return
-        admin = await self.admin_operator.get_validated_admin_by_id(self.db, self.selected_admin_id)
-        user_count = len(admin.users or [])
+        admin, user_count = await self._selected_admin_with_user_count()
         self.app.push_screen(
             AdminDelete(self.db, self.admin_operator, admin.id, admin.username, self._refresh_table, user_count)
         )
@@ -757,8 +764,7 @@ class AdminContent(Static):
     async def action_delete_admin_users(self):
         if not self.table.columns:
             return
-        admin = await self.admin_operator.get_validated_admin_by_id(self.db, self.selected_admin_id)
-        user_count = len(admin.users or [])
+        admin, user_count = await self._selected_admin_with_user_count()
         self.app.push_screen(
             AdminDeleteUsers(self.db, self.admin_operator, admin.id, admin.username, self._refresh_table, user_count)
         )